@@ -47,7 +47,19 @@ EVENT_TYPES = frozenset({
 # SSE Connection Management
 # ============================================================================
 
-@dataclass
+# Max events buffered per connection (bounds memory for stalled or slow
+# clients). On overflow the connection's pending events are discarded, a
+# terminal resync event is queued in their place and the connection is
+# unregistered, so the client sees its stream end instead of silently
+# missing events.
+SSE_QUEUE_MAXSIZE = 1000
+
+# Terminal event sent to a connection that fell behind; the stream closes
+# after it and the client must refetch state and reconnect
+SSE_RESYNC_EVENT = "resync"
+
+
+@dataclass(slots=True)
 class SSEConnection:
     """Represents an active SSE connection.
 
@@ -56,12 +68,14 @@ class SSEConnection:
     - The authenticated user's ID
     - Set of scope UUIDs to filter events
     - A queue for events targeting this connection
+
+    Slotted: one instance per open stream, with no per-instance __dict__.
     """
     client_id: str
     user_id: str
     username: str
     subscribed_scopes: Set[str]
-    queue: Queue.Queue = field(default_factory=Queue.Queue)
+    queue: Queue.Queue = field(default_factory=lambda: Queue.Queue(maxsize=SSE_QUEUE_MAXSIZE))
 
     def is_subscribed_to(self, scope_uuid: Optional[str]) -> bool:
         """Check if connection is subscribed to events for a scope.
@@ -85,10 +99,13 @@ class SSEManager:
         sse_manager.publish("artifact_delta", {...}, scope_uuid="core_abc")
 
     The manager routes events only to connections subscribed to the target scope.
+    Scoped events are routed through a scope -> client ID index, so publishing
+    touches only the subscribed connections instead of scanning all of them.
     """
 
     def __init__(self):
         self._connections: Dict[str, SSEConnection] = {}
+        self._scope_index: Dict[str, Set[str]] = {}
         self._lock = threading.Lock()
         self._client_id_counter = 0
 
@@ -118,6 +135,8 @@ class SSEManager:
                 subscribed_scopes=scopes,
             )
             self._connections[client_id] = conn
+            for scope_uuid in scopes:
+                self._scope_index.setdefault(scope_uuid, set()).add(client_id)
             logger.info(
                 f"SSE connection registered: {client_id} for user {username}, "
                 f"subscribed to {len(scopes)} scope(s)"
@@ -134,13 +153,40 @@ class SSEManager:
             The removed connection, or None if not found
         """
         with self._lock:
-            conn = self._connections.pop(client_id, None)
-            if conn:
-                logger.info(
-                    f"SSE connection unregistered: {client_id} "
-                    f"(user: {conn.username})"
-                )
-            return conn
+            return self._unregister_locked(client_id)
+
+    def _unregister_locked(self, client_id: str) -> Optional[SSEConnection]:
+        """Remove an SSE connection; caller must hold self._lock."""
+        conn = self._connections.pop(client_id, None)
+        if conn:
+            for scope_uuid in conn.subscribed_scopes:
+                subscribers = self._scope_index.get(scope_uuid)
+                if subscribers is not None:
+                    subscribers.discard(client_id)
+                    if not subscribers:
+                        del self._scope_index[scope_uuid]
+            logger.info(
+                f"SSE connection unregistered: {client_id} "
+                f"(user: {conn.username})"
+            )
+        return conn
+
+    def _close_for_resync(self, conn: SSEConnection, dropped_event: str) -> None:
+        """End an overflowing connection with a terminal resync event.
+
+        Its buffered events are discarded (the client has to resync anyway),
+        which frees room for the sentinel. Caller must hold self._lock.
+        """
+        while True:
+            try:
+                conn.queue.get_nowait()
+            except Queue.Empty:
+                break
+        conn.queue.put_nowait({
+            "type": SSE_RESYNC_EVENT,
+            "data": {"reason": "queue_overflow", "dropped_event": dropped_event},
+        })
+        self._unregister_locked(conn.client_id)
 
     def publish(
         self,
@@ -167,19 +213,28 @@ class SSEManager:
         published_count = 0
 
         with self._lock:
-            for conn in self._connections.values():
-                if conn.is_subscribed_to(scope_uuid):
-                    try:
-                        conn.queue.put(
-                            {"type": event_type, "data": data},
-                            block=False
-                        )
-                        published_count += 1
-                    except queue.Full:
-                        logger.warning(
-                            f"SSE queue full for {conn.client_id}, "
-                            f"dropping event: {event_type}"
-                        )
+            if scope_uuid is None:
+                # Global event - every connection receives it
+                targets = list(self._connections.values())
+            else:
+                targets = [
+                    self._connections[client_id]
+                    for client_id in self._scope_index.get(scope_uuid, ())
+                ]
+
+            for conn in targets:
+                try:
+                    conn.queue.put(
+                        {"type": event_type, "data": data},
+                        block=False
+                    )
+                    published_count += 1
+                except Queue.Full:
+                    logger.warning(
+                        f"SSE queue full for {conn.client_id}, "
+                        f"closing stream for resync at event: {event_type}"
+                    )
+                    self._close_for_resync(conn, event_type)
 
         logger.debug(
             f"SSE event published: {event_type} -> {published_count} connection(s)"
@@ -271,6 +326,9 @@ def events_stream():
     Reconnection:
         Client should auto-reconnect on disconnect.
         Events sent during disconnect are not buffered (MVP limitation).
+        A client that falls SSE_QUEUE_MAXSIZE events behind receives a final
+        "resync" event and the stream closes; it should refetch state
+        before reconnecting.
     """
     # Get authenticated user info from Flask g object
     # @auth_required decorator already authenticated the request
@@ -305,6 +363,10 @@ def events_stream():
                     yield f"event: {event['type']}\n"
                     yield f"data: {json.dumps(event['data'])}\n\n"
 
+                    # Connection was dropped for falling behind; end the stream
+                    if event["type"] == SSE_RESYNC_EVENT:
+                        return
+
                 except Queue.Empty:
                     # Send keepalive comment to prevent timeout
                     # Format: : comment\n\n (ignored by clients)
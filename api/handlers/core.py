@@ -17,11 +17,14 @@ Publishes SSE events for context and scope operations:
 - scope_modified: Published when Scope entity data changes
 """
 
-import json
+import copy
 import logging
 
+import orjson
+from flask import g, has_request_context
+
 from system.core import get_core
-from system.exceptions import ResourceNotFound
+from system.exceptions import ResourceNotFound, ValidationError
 from utils import uid
 
 from ..schemas.semantic import (
@@ -53,7 +56,8 @@ logger = logging.getLogger(__name__)
 # Baseline entity types that can be created via Semantic API
 # Session 1: These are the types defined in memogarden/schemas/types/entities/
 # Session 18: Added ConversationLog for Project Studio
-BASELINE_ENTITY_TYPES = {
+# Immutable frozenset, checked on every create
+BASELINE_ENTITY_TYPES = frozenset({
     "Transaction",
     "Recurrence",
     "Artifact",
@@ -62,7 +66,24 @@ BASELINE_ENTITY_TYPES = {
     "Agent",
     "Entity",  # Generic entity type
     "ConversationLog",  # Session 18: Project Studio conversation
-}
+})
+
+# Raised by leave/focus when the operator has never entered a scope
+_NO_CONTEXT_FRAME_MESSAGE = "No active context frame. You must enter a scope first."
+
+# Verbs that never write, so they leave memoized explore results valid
+READ_ONLY_OPS = frozenset({
+    "get",
+    "query",
+    "get_relation",
+    "query_relation",
+    "explore",
+    "track",
+    "search",
+    "get_artifact_at_commit",
+    "diff_commits",
+    "get_conversation",
+})
 
 
 # ============================================================================
@@ -109,8 +130,8 @@ def _row_to_entity_response(row, entity_type: str = "Entity") -> dict:
     # sqlite3.Row doesn't have .get(), use direct access with exception handling
     try:
         data_value = row["data"]
-        data = json.loads(data_value) if data_value else {}
-    except (json.JSONDecodeError, TypeError, KeyError):
+        data = orjson.loads(data_value) if data_value else {}
+    except (orjson.JSONDecodeError, KeyError):
         data = {}
 
     # Helper to safely get optional values from sqlite3.Row
@@ -144,6 +165,67 @@ def _row_to_entity_response(row, entity_type: str = "Entity") -> dict:
     }
 
 
+def _scope_state_response(context_frame, scope_uuid: str) -> dict:
+    """Serialize the scope state of a ContextFrame for enter/leave/focus.
+
+    Active scopes are returned sorted so the response is deterministic
+    whether the frame keeps active_scopes as a list or as a set.
+
+    Args:
+        context_frame: ContextFrame after the scope operation
+        scope_uuid: Unprefixed UUID of the scope the verb targeted
+
+    Returns:
+        dict with scope, active_scopes and primary_scope (core_ prefixed)
+    """
+    primary_scope = context_frame.primary_scope
+    return {
+        "scope": uid.add_core_prefix(scope_uuid),
+        "active_scopes": sorted(uid.add_core_prefix(s) for s in (context_frame.active_scopes or ())),
+        "primary_scope": uid.add_core_prefix(primary_scope) if primary_scope else None,
+    }
+
+
+def _row_to_relation_response(row) -> dict:
+    """Convert a user_relation row to relation response dict.
+
+    Adds core_ prefix to UUIDs. metadata and evidence are stored as JSON
+    text and decoded with orjson, the same parser the app's JSON
+    provider uses.
+    """
+    return {
+        "uuid": uid.add_core_prefix(row["uuid"]),
+        "kind": row["kind"],
+        "source": uid.add_core_prefix(row["source"]),
+        "source_type": row["source_type"],
+        "target": uid.add_core_prefix(row["target"]),
+        "target_type": row["target_type"],
+        "time_horizon": row["time_horizon"],
+        "last_access_at": row["last_access_at"],
+        "created_at": row["created_at"],
+        "metadata": orjson.loads(row["metadata"]) if row["metadata"] else None,
+        "evidence": orjson.loads(row["evidence"]) if row["evidence"] else None,
+    }
+
+
+def _explore_memo() -> dict | None:
+    """Explore results memoized for the current request.
+
+    Returns None outside a request context (no memoization).
+    """
+    if not has_request_context():
+        return None
+    if "explore_memo" not in g:
+        g.explore_memo = {}
+    return g.explore_memo
+
+
+def clear_explore_memo() -> None:
+    """Drop memoized explore results; called before any writing verb."""
+    if has_request_context():
+        g.pop("explore_memo", None)
+
+
 # ============================================================================
 # Verb Handlers
 # ============================================================================
@@ -494,19 +576,7 @@ def handle_edit_relation(request: EditRequest, actor: str) -> dict:
             scope_uuid=None,  # Relations are cross-scope, global event
         )
 
-        return {
-            "uuid": uid.add_core_prefix(row["uuid"]),
-            "kind": row["kind"],
-            "source": uid.add_core_prefix(row["source"]),
-            "source_type": row["source_type"],
-            "target": uid.add_core_prefix(row["target"]),
-            "target_type": row["target_type"],
-            "time_horizon": row["time_horizon"],
-            "last_access_at": row["last_access_at"],
-            "created_at": row["created_at"],
-            "metadata": json.loads(row["metadata"]) if row["metadata"] else None,
-            "evidence": json.loads(row["evidence"]) if row["evidence"] else None,
-        }
+        return _row_to_relation_response(row)
 
 
 @with_audit
@@ -526,19 +596,7 @@ def handle_get_relation(request: GetRequest, actor: str) -> dict:
     with get_core() as core:
         row = core.relation.get_by_id(request.target)
 
-        return {
-            "uuid": uid.add_core_prefix(row["uuid"]),
-            "kind": row["kind"],
-            "source": uid.add_core_prefix(row["source"]),
-            "source_type": row["source_type"],
-            "target": uid.add_core_prefix(row["target"]),
-            "target_type": row["target_type"],
-            "time_horizon": row["time_horizon"],
-            "last_access_at": row["last_access_at"],
-            "created_at": row["created_at"],
-            "metadata": json.loads(row["metadata"]) if row["metadata"] else None,
-            "evidence": json.loads(row["evidence"]) if row["evidence"] else None,
-        }
+        return _row_to_relation_response(row)
 
 
 @with_audit
@@ -566,21 +624,7 @@ def handle_query_relation(request: QueryRelationRequest, actor: str) -> dict:
             limit=request.limit,
         )
 
-        results = []
-        for row in rows:
-            results.append({
-                "uuid": uid.add_core_prefix(row["uuid"]),
-                "kind": row["kind"],
-                "source": uid.add_core_prefix(row["source"]),
-                "source_type": row["source_type"],
-                "target": uid.add_core_prefix(row["target"]),
-                "target_type": row["target_type"],
-                "time_horizon": row["time_horizon"],
-                "last_access_at": row["last_access_at"],
-                "created_at": row["created_at"],
-                "metadata": json.loads(row["metadata"]) if row["metadata"] else None,
-                "evidence": json.loads(row["evidence"]) if row["evidence"] else None,
-            })
+        results = [_row_to_relation_response(row) for row in rows]
 
         return {
             "results": results,
@@ -598,6 +642,11 @@ def handle_explore(request: ExploreRequest, actor: str) -> dict:
     Traverses the relation graph to find connected entities/facts.
     Supports direction control (outgoing, incoming, both) and radius limits.
 
+    Results are memoized per request, so repeated explores of the same
+    anchor in one /mg batch traverse once. Each caller gets its own copy of
+    the result, so annotating one batch entry cannot leak into another.
+    Any writing verb in the request clears the memo (see clear_explore_memo).
+
     Args:
         request: Validated ExploreRequest
         actor: Authenticated user/agent UUID
@@ -611,6 +660,17 @@ def handle_explore(request: ExploreRequest, actor: str) -> dict:
     """
     from system.soil import get_soil
 
+    memo = _explore_memo()
+    memo_key = (
+        uid.strip_prefix(request.anchor),
+        request.direction,
+        request.radius,
+        request.kind,
+        request.limit,
+    )
+    if memo is not None and memo_key in memo:
+        return copy.deepcopy(memo[memo_key])
+
     with get_core() as core:
         # Track visited nodes and edges to avoid duplicates
         visited_nodes = set()
@@ -695,6 +755,7 @@ def handle_explore(request: ExploreRequest, actor: str) -> dict:
 
         # Get node details for all visited nodes
         # Note: This combines both Core entities and Soil items
+        soil_candidates = []
         for node_uuid in visited_nodes:
             # Try to get from Core first
             try:
@@ -713,29 +774,40 @@ def handle_explore(request: ExploreRequest, actor: str) -> dict:
                 logger.warning(f"Error looking up Core entity {node_uuid}: {e}")
                 pass
 
-            # Try to get from Soil
+            soil_candidates.append(node_uuid)
+
+        # Look up the remaining nodes in Soil through one connection
+        if soil_candidates:
             try:
                 with get_soil() as soil:
-                    item = soil.get_fact(node_uuid)
-                    if item:
-                        nodes.append({
-                            "uuid": uid.add_soil_prefix(item.uuid),
-                            "layer": "soil",
-                            "type": item._type,
-                        })
-            except ResourceNotFound:
-                # Fact not found in Soil either - skip
-                pass
+                    for node_uuid in soil_candidates:
+                        try:
+                            item = soil.get_fact(node_uuid)
+                            if item:
+                                nodes.append({
+                                    "uuid": uid.add_soil_prefix(item.uuid),
+                                    "layer": "soil",
+                                    "type": item._type,
+                                })
+                        except ResourceNotFound:
+                            # Fact not found in Soil either - skip
+                            pass
+                        except Exception as e:
+                            # Log unexpected errors
+                            logger.warning(f"Error looking up Soil item {node_uuid}: {e}")
+                            pass
             except Exception as e:
-                # Log unexpected errors
-                logger.warning(f"Error looking up Soil item {node_uuid}: {e}")
-                pass
+                # Soil unavailable - report Core nodes only
+                logger.warning(f"Error opening Soil for explore nodes: {e}")
 
-        return {
+        result = {
             "nodes": nodes,
             "edges": edges,
             "count": len(nodes),
         }
+        if memo is not None:
+            memo[memo_key] = copy.deepcopy(result)
+        return result
 
 
 @with_audit
@@ -885,11 +957,7 @@ def handle_enter(request: EnterRequest, actor: str) -> dict:
             scope_uuid=uid.add_core_prefix(scope_uuid),
         )
 
-        return {
-            "scope": uid.add_core_prefix(scope_uuid),
-            "active_scopes": [uid.add_core_prefix(s) for s in (context_frame.active_scopes or [])],
-            "primary_scope": uid.add_core_prefix(context_frame.primary_scope) if context_frame.primary_scope else None
-        }
+        return _scope_state_response(context_frame, scope_uuid)
 
 
 @with_audit
@@ -910,7 +978,7 @@ def handle_leave(request: LeaveRequest, actor: str) -> dict:
         dict with scope and active_scopes
 
     Raises:
-        ResourceNotFound: If user has no ContextFrame
+        ValidationError: If user has no ContextFrame
         ValueError: If scope not in active set
     """
     with get_core() as core:
@@ -921,11 +989,9 @@ def handle_leave(request: LeaveRequest, actor: str) -> dict:
                 owner_type="operator",
                 create_if_missing=False
             )
-        except Exception as e:
-            # Convert to ValueError for consistent 400 response
-            if "not found" in str(e).lower():
-                raise ValueError("No active context frame. You must enter a scope first.") from None
-            raise
+        except ResourceNotFound:
+            # No frame yet is a client error (400), not a missing resource
+            raise ValidationError(_NO_CONTEXT_FRAME_MESSAGE) from None
 
         # Strip prefix from scope UUID
         scope_uuid = uid.strip_prefix(request.scope)
@@ -950,11 +1016,7 @@ def handle_leave(request: LeaveRequest, actor: str) -> dict:
             scope_uuid=uid.add_core_prefix(scope_uuid),
         )
 
-        return {
-            "scope": uid.add_core_prefix(scope_uuid),
-            "active_scopes": [uid.add_core_prefix(s) for s in (context_frame.active_scopes or [])],
-            "primary_scope": uid.add_core_prefix(context_frame.primary_scope) if context_frame.primary_scope else None
-        }
+        return _scope_state_response(context_frame, scope_uuid)
 
 
 @with_audit
@@ -975,7 +1037,7 @@ def handle_focus(request: FocusRequest, actor: str) -> dict:
         dict with scope and primary_scope
 
     Raises:
-        ResourceNotFound: If user has no ContextFrame
+        ValidationError: If user has no ContextFrame
         ValueError: If scope not in active set
     """
     with get_core() as core:
@@ -986,11 +1048,9 @@ def handle_focus(request: FocusRequest, actor: str) -> dict:
                 owner_type="operator",
                 create_if_missing=False
             )
-        except Exception as e:
-            # Convert to ValueError for consistent 400 response
-            if "not found" in str(e).lower():
-                raise ValueError("No active context frame. You must enter a scope first.") from None
-            raise
+        except ResourceNotFound:
+            # No frame yet is a client error (400), not a missing resource
+            raise ValidationError(_NO_CONTEXT_FRAME_MESSAGE) from None
 
         # Strip prefix from scope UUID
         scope_uuid = uid.strip_prefix(request.scope)
@@ -1015,11 +1075,7 @@ def handle_focus(request: FocusRequest, actor: str) -> dict:
             scope_uuid=uid.add_core_prefix(scope_uuid),
         )
 
-        return {
-            "scope": uid.add_core_prefix(scope_uuid),
-            "primary_scope": uid.add_core_prefix(context_frame.primary_scope) if context_frame.primary_scope else None,
-            "active_scopes": [uid.add_core_prefix(s) for s in (context_frame.active_scopes or [])]
-        }
+        return _scope_state_response(context_frame, scope_uuid)
 
 
 # ============================================================================
@@ -1051,6 +1107,13 @@ def handle_search(request: SearchRequest, actor: str) -> dict:
 
     Continuation tokens enable pagination for large result sets.
 
+    limit caps the whole page, and the sources are only asked for what can
+    still fit. Entities are searched first with limit. Facts are then
+    searched only for the rest of the page: at most limit // 2 when
+    entities could fill their half, more when they matched fewer, and
+    Soil is not opened at all when nothing is left (e.g. limit=1). Entities
+    then fill any share the facts did not use.
+
     Args:
         request: Validated SearchRequest
         actor: Authenticated user/agent UUID
@@ -1080,25 +1143,32 @@ def handle_search(request: SearchRequest, actor: str) -> dict:
                 entity_results.append(_add_core_prefix(entity))
 
     # Search facts (Soil/Facts) - using public API
-    if request.target_type in ("fact", "all"):
+    # Entities keep up to limit - limit // 2 slots; facts are only asked
+    # for what is left, so Soil never fetches rows that cannot fit
+    fact_limit = request.limit - min(
+        len(entity_results), request.limit - request.limit // 2
+    )
+    if request.target_type in ("fact", "all") and fact_limit > 0:
         with get_soil() as soil:
             # Use public search API instead of direct _conn access
             item_rows = soil.search_items(
                 query=request.query,
                 coverage=request.coverage,
-                limit=request.limit
+                limit=fact_limit
             )
 
             # Convert to response format
             for row in item_rows:
-                # Parse JSON fields
+                # Parse JSON fields (orjson: decoded once per row on every search)
                 try:
-                    data = json.loads(row["data"]) if row["data"] else {}
-                except (json.JSONDecodeError, TypeError, KeyError):
+                    data_value = row["data"]
+                    data = orjson.loads(data_value) if data_value else {}
+                except (orjson.JSONDecodeError, KeyError):
                     data = {}
                 try:
-                    metadata = json.loads(row["metadata"]) if row["metadata"] else {}
-                except (json.JSONDecodeError, TypeError, KeyError):
+                    metadata_value = row["metadata"]
+                    metadata = orjson.loads(metadata_value) if metadata_value else {}
+                except (orjson.JSONDecodeError, KeyError):
                     metadata = {}
 
                 fact_results.append({
@@ -1113,8 +1183,9 @@ def handle_search(request: SearchRequest, actor: str) -> dict:
                     "kind": "fact",  # Add kind marker for disambiguation
                 })
 
-    # Merge and deduplicate results
-    # Session 9: Simple concatenation (entities first, then facts)
+    # Merge results (entities first, then facts)
+    # Facts already fit the page; entities fill whatever facts left unused
+    entity_results = entity_results[:request.limit - len(fact_results)]
     results = entity_results + fact_results
 
     # TODO: Continuation token implementation (RFC-005)
@@ -28,16 +28,18 @@ The old cleanup decorators (with_core_cleanup, with_soil_cleanup) have been remo
 Session 6: Audit Facts (RFC-005 v7 Section 7)
 ----------------------------------------------
 The with_audit decorator adds audit logging for all Semantic API operations:
-- Action fact: Created immediately when operation starts
+- Action fact: Built (and timestamped) when operation starts
 - ActionResult fact: Created when operation completes (success/failure)
 - result_of relation: Links ActionResult to Action
+- All three are written in a single Soil transaction at completion
 - bypass_semantic_api flag: Prevents recursion in audit logging
 """
 
 import json
+import logging
 import time
 import traceback
-from functools import wraps
+from functools import lru_cache, wraps
 
 from system.core import get_core
 from system.soil import Fact, SystemRelation, current_day, generate_soil_uuid, get_soil
@@ -50,6 +52,8 @@ from system.exceptions import (
     PermissionDenied,
 )
 
+logger = logging.getLogger(__name__)
+
 
 # ============================================================================
 # Audit Decorator (Session 6)
@@ -66,6 +70,10 @@ def with_audit(handler_func):
     2. ActionResult fact at operation end (status, duration, result/error)
     3. result_of relation linking ActionResult → Action
 
+    The Action is built (and timestamped) when the operation starts, but all
+    three records are written together in one Soil transaction when it ends,
+    so each audited request costs a single commit.
+
     Uses bypass_semantic_api flag to prevent recursion when creating audit facts.
 
     Args:
@@ -77,37 +85,32 @@ def with_audit(handler_func):
     @wraps(handler_func)
     def wrapper(request, actor):
         # Check if audit logging is bypassed (to prevent recursion)
-        # Use getattr to safely check request model
+        # getattr with a default: one attribute probe, works for non-models
         request_model = request if hasattr(request, 'model_dump') else None
-        bypass_audit = getattr(request_model, 'bypass_semantic_api', False) if request_model else False
-
-        if bypass_audit:
+        if getattr(request_model, 'bypass_semantic_api', False):
             # Audit disabled for this request - call handler directly
             return handler_func(request, actor)
 
-        action_uuid = None
-        operation = None
         start_time = time.time()
 
         # Extract operation name before creating context
-        if hasattr(request_model, 'op'):
-            operation = request_model.op
-        elif hasattr(request, 'op'):
-            operation = request.op
-        else:
+        operation = getattr(request, 'op', None)
+        if operation is None:
             # Fallback: derive from handler name
             operation = handler_func.__name__.replace('handle_', '')
 
         # Generate request ID for correlation
         request_id = uid.generate_uuid()
 
-        # Create Action fact immediately (separate context for immediate commit)
+        # Build Action fact now so realized_at reflects operation start;
+        # it is written together with its ActionResult below
         action_uuid = generate_soil_uuid()
+        started_at = isodatetime.now()
         action_item = Fact(
             uuid=action_uuid,
             _type="Action",
-            realized_at=isodatetime.now(),
-            canonical_at=isodatetime.now(),
+            realized_at=started_at,
+            canonical_at=started_at,
             data={
                 "actor": actor,
                 "operation": operation,
@@ -118,129 +121,102 @@ def with_audit(handler_func):
             }
         )
 
-        # Use separate context for Action (immediate commit so other agents can see "in progress")
-        with get_soil() as soil:
-            soil.create_fact(action_item)
-            # Commits on __exit__
-
         try:
             # Call the actual handler
             result = handler_func(request, actor)
-
-            # Create ActionResult fact (success) - separate context
+        except Exception as e:
             duration_ms = int((time.time() - start_time) * 1000)
-            actionresult_uuid = generate_soil_uuid()
+            finished_at = isodatetime.now()
 
+            # Capture structured error information (RFC-005 v7.1)
             actionresult_item = Fact(
-                uuid=actionresult_uuid,
+                uuid=generate_soil_uuid(),
                 _type="ActionResult",
-                realized_at=isodatetime.now(),
-                canonical_at=isodatetime.now(),
+                realized_at=finished_at,
+                canonical_at=finished_at,
                 data={
-                    "result": result if _is_json_serializable(result) else None,
-                    "error": None,
-                    "result_summary": _generate_result_summary(operation, result, success=True),
+                    "result": None,
+                    "error": {
+                        "code": _get_error_code(e),
+                        "message": str(e),
+                        "details": _extract_error_details(e),
+                    },
+                    "result_summary": _generate_result_summary(operation, None, success=False, error=e),
                     "duration_ms": duration_ms,
-                    "status": "success",
+                    "status": "error",
+                    "error_type": f"{e.__class__.__module__}.{e.__class__.__name__}",
+                    "error_traceback": traceback.format_exc(),
                 }
             )
 
-            # Create ActionResult and relation in single transaction
-            with get_soil() as soil:
-                soil.create_fact(actionresult_item)
-
-                # Create result_of relation
-                relation = SystemRelation(
-                    uuid=generate_soil_uuid(),
-                    kind="result_of",
-                    source=actionresult_uuid,
-                    source_type="item",
-                    target=action_uuid,
-                    target_type="item",
-                    created_at=current_day(),
-                    evidence={
-                        "source": "system_inferred",
-                        "method": "audit_logging",
-                    }
+            try:
+                _write_audit_facts(action_item, actionresult_item)
+            except Exception as audit_error:
+                # If audit logging fails, don't hide the original error
+                # Log and continue with original exception
+                logger.exception(
+                    "Failed to create audit facts for action=%s operation=%s error=%s",
+                    action_uuid,
+                    operation,
+                    str(audit_error)
                 )
-                soil.create_relation(relation)
-                # Commits on __exit__
-
-            return result
-
-        except Exception as e:
-            # Create ActionResult fact (error) - separate context
-            duration_ms = int((time.time() - start_time) * 1000)
-            actionresult_uuid = generate_soil_uuid()
-
-            # Capture structured error information (RFC-005 v7.1)
-            error_code = _get_error_code(e)
-            error_message = str(e)
-            error_details = _extract_error_details(e)
-            error_type = f"{e.__class__.__module__}.{e.__class__.__name__}"
-            error_traceback = traceback.format_exc()
-
-            # Only create ActionResult if Action was created successfully
-            if action_uuid:
-                try:
-                    actionresult_item = Fact(
-                        uuid=actionresult_uuid,
-                        _type="ActionResult",
-                        realized_at=isodatetime.now(),
-                        canonical_at=isodatetime.now(),
-                        data={
-                            "result": None,
-                            "error": {
-                                "code": error_code,
-                                "message": error_message,
-                                "details": error_details,
-                            },
-                            "result_summary": _generate_result_summary(operation, None, success=False, error=e),
-                            "duration_ms": duration_ms,
-                            "status": "error",
-                            "error_type": error_type,
-                            "error_traceback": error_traceback,
-                        }
-                    )
-
-                    # Create ActionResult and relation in single transaction
-                    with get_soil() as soil:
-                        soil.create_fact(actionresult_item)
-
-                        # Create result_of relation
-                        relation = SystemRelation(
-                            uuid=generate_soil_uuid(),
-                            kind="result_of",
-                            source=actionresult_uuid,
-                            source_type="item",
-                            target=action_uuid,
-                            target_type="item",
-                            created_at=current_day(),
-                            evidence={
-                                "source": "system_inferred",
-                                "method": "audit_logging",
-                            }
-                        )
-                        soil.create_relation(relation)
-                        # Commits on __exit__
-                except Exception as audit_error:
-                    # If audit logging fails, don't hide the original error
-                    # Log and continue with original exception
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.exception(
-                        "Failed to create audit ActionResult for action=%s operation=%s error=%s",
-                        action_uuid,
-                        operation,
-                        str(audit_error)
-                    )
 
             # Re-raise the original exception
             raise
 
+        duration_ms = int((time.time() - start_time) * 1000)
+        finished_at = isodatetime.now()
+        actionresult_item = Fact(
+            uuid=generate_soil_uuid(),
+            _type="ActionResult",
+            realized_at=finished_at,
+            canonical_at=finished_at,
+            data={
+                "result": result if _is_json_serializable(result) else None,
+                "error": None,
+                "result_summary": _generate_result_summary(operation, result, success=True),
+                "duration_ms": duration_ms,
+                "status": "success",
+            }
+        )
+        _write_audit_facts(action_item, actionresult_item)
+
+        return result
+
     return wrapper
 
 
+def _write_audit_facts(action_item: Fact, actionresult_item: Fact) -> None:
+    """Write an Action, its ActionResult and their result_of relation.
+
+    All three records go through one Soil context, so they are committed
+    together (or not at all).
+
+    Args:
+        action_item: Action fact built at operation start
+        actionresult_item: ActionResult fact built at operation end
+    """
+    relation = SystemRelation(
+        uuid=generate_soil_uuid(),
+        kind="result_of",
+        source=actionresult_item.uuid,
+        source_type="item",
+        target=action_item.uuid,
+        target_type="item",
+        created_at=current_day(),
+        evidence={
+            "source": "system_inferred",
+            "method": "audit_logging",
+        }
+    )
+
+    with get_soil() as soil:
+        soil.create_fact(action_item)
+        soil.create_fact(actionresult_item)
+        soil.create_relation(relation)
+        # Commits on __exit__
+
+
 # ============================================================================
 # Helper Functions for Audit Decorator
 # ============================================================================
@@ -329,6 +305,30 @@ def _generate_result_summary(operation: str, result, success: bool, error: Excep
     return f"{operation} completed"
 
 
+# Exception class -> RFC-005 v7.1 error code. Subclasses resolve through
+# their MRO (see _error_code_for_class).
+_EXCEPTION_ERROR_CODES: dict[type, str] = {
+    ValidationError: "validation_error",
+    ResourceNotFound: "not_found",
+    LockConflictError: "lock_conflict",
+    PermissionDenied: "permission_denied",
+}
+
+
+@lru_cache(maxsize=256)
+def _error_code_for_class(exception_class: type) -> str:
+    """Resolve an error code by walking the exception class MRO.
+
+    Cached per class, so each exception type is classified once.
+    """
+    for cls in exception_class.__mro__:
+        code = _EXCEPTION_ERROR_CODES.get(cls)
+        if code is not None:
+            return code
+    # Default to internal_error for unknown exceptions
+    return "internal_error"
+
+
 def _get_error_code(exception: Exception) -> str:
     """Map exception type to error code per RFC-005 v7.1.
 
@@ -339,18 +339,7 @@ def _get_error_code(exception: Exception) -> str:
         Error code string (validation_error, not_found, lock_conflict,
         permission_denied, or internal_error)
     """
-    # Map specific exception types to error codes
-    if isinstance(exception, ValidationError):
-        return "validation_error"
-    elif isinstance(exception, ResourceNotFound):
-        return "not_found"
-    elif isinstance(exception, LockConflictError):
-        return "lock_conflict"
-    elif isinstance(exception, PermissionDenied):
-        return "permission_denied"
-    else:
-        # Default to internal_error for unknown exceptions
-        return "internal_error"
+    return _error_code_for_class(type(exception))
 
 
 def _extract_error_details(exception: Exception) -> dict | None:
@@ -363,8 +352,9 @@ def _extract_error_details(exception: Exception) -> dict | None:
         Dictionary with error details, or None if no details available
     """
     # Check if exception has a details attribute (MemoGardenError)
-    if hasattr(exception, 'details') and exception.details is not None:
-        return exception.details
+    details = getattr(exception, 'details', None)
+    if details is not None:
+        return details
 
     # For validation errors, try to extract field names
     if isinstance(exception, ValidationError):
@@ -13,9 +13,10 @@ Publishes SSE events for fact operations:
 - message_sent: Published when Message fact is added
 """
 
-import json
 import logging
 
+import orjson
+
 from system.soil import Fact, current_day, generate_soil_uuid, get_soil
 from utils import isodatetime, uid
 
@@ -32,14 +33,15 @@ logger = logging.getLogger(__name__)
 
 # Baseline fact types that can be added via Semantic API
 # Session 2: These are the types defined in memogarden/schemas/types/facts/
-BASELINE_ITEM_TYPES = {
+# Immutable frozenset, checked on every add
+BASELINE_ITEM_TYPES = frozenset({
     "Note",
     "Message",
     "Email",
     "ToolCall",
     "EntityDelta",
     "SystemEvent",
-}
+})
 
 
 # ============================================================================
@@ -77,15 +79,15 @@ def _row_to_fact_response(row) -> dict:
     # Parse JSON data if present
     try:
         data_value = row["data"]
-        data = json.loads(data_value) if data_value else {}
-    except (json.JSONDecodeError, TypeError, KeyError):
+        data = orjson.loads(data_value) if data_value else {}
+    except (orjson.JSONDecodeError, KeyError):
         data = {}
 
     # Parse JSON metadata if present
     try:
         metadata_value = row["metadata"]
-        metadata = json.loads(metadata_value) if metadata_value else {}
-    except (json.JSONDecodeError, TypeError, KeyError):
+        metadata = orjson.loads(metadata_value) if metadata_value else {}
+    except (orjson.JSONDecodeError, KeyError):
         metadata = {}
 
     # Helper to safely get optional values from sqlite3.Row
@@ -0,0 +1,69 @@
+"""orjson-backed JSON provider for the Flask app.
+
+Every API response (REST and /mg envelopes alike) goes through
+app.json, so swapping the stdlib encoder for orjson speeds up both
+jsonify() and request.get_json() without touching handlers.
+
+Output stays compatible with Flask's DefaultJSONProvider:
+- Keys are sorted (DefaultJSONProvider.sort_keys defaults to True)
+- Non-string dict keys are stringified, as the stdlib encoder does
+- datetime, date, Decimal, dataclasses and __html__ objects go through
+  Flask's own default hook, so e.g. datetimes keep the HTTP date format
+- Integers outside orjson's 64-bit range fall back to the stdlib json
+  module in both directions, so they are neither rejected on output nor
+  silently turned into floats on input
+"""
+
+import json
+import re
+import typing as t
+
+import orjson
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+_DUMPS_OPTIONS = (
+    orjson.OPT_SORT_KEYS
+    | orjson.OPT_NON_STR_KEYS
+    | orjson.OPT_PASSTHROUGH_DATETIME
+    | orjson.OPT_PASSTHROUGH_DATACLASS
+)
+
+# A run of 20+ digits may be an integer beyond 64 bits, which orjson.loads
+# would decode as a float; such documents are decoded by the stdlib instead
+_LONG_DIGITS_BYTES = re.compile(rb"[0-9]{20}")
+_LONG_DIGITS_STR = re.compile(r"[0-9]{20}")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+
+    default: t.Callable[[t.Any], t.Any] = staticmethod(DefaultJSONProvider.default)
+
+    def dumps(self, obj: t.Any, **kwargs: t.Any) -> str:
+        """Serialize obj to a JSON string.
+
+        Stdlib-only keyword arguments (indent, separators, ...) are ignored.
+        orjson rejects integers beyond 64 bits with TypeError; those objects
+        are serialized by the stdlib with the same compact, sorted output.
+        """
+        try:
+            return orjson.dumps(obj, default=self.default, option=_DUMPS_OPTIONS).decode()
+        except TypeError:
+            return json.dumps(
+                obj,
+                default=self.default,
+                sort_keys=True,
+                ensure_ascii=False,
+                separators=(",", ":"),
+            )
+
+    def loads(self, s: str | bytes, **kwargs: t.Any) -> t.Any:
+        """Deserialize a JSON string or bytes.
+
+        Documents that may hold integers beyond 64 bits are decoded by the
+        stdlib, which keeps them as exact ints.
+        """
+        pattern = _LONG_DIGITS_BYTES if isinstance(s, (bytes, bytearray)) else _LONG_DIGITS_STR
+        if pattern.search(s):
+            return json.loads(s)
+        return orjson.loads(s)
@@ -18,6 +18,8 @@ from system.exceptions import (
     ValidationError,
 )
 
+from .json_provider import OrjsonProvider
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -87,6 +89,7 @@ def create_app(test_config=None):
     from .config import settings
 
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Load config
     if test_config:
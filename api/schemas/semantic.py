@@ -39,7 +39,8 @@ class SemanticRequest(BaseModel):
         "track", "search",
         # "register",  # TODO: Not yet implemented (RFC-005 v7)
         "commit_artifact", "get_artifact_at_commit", "diff_commits",
-        "fold", "get_conversation"
+        "fold", "get_conversation",
+        "batch",
     ] = Field(..., description="Operation verb")
     bypass_semantic_api: bool = Field(default=False, description="If True, skip audit logging (internal use)")
 
@@ -605,6 +606,33 @@ class FoldRequest(SemanticRequest):
     )
 
 
+# ============================================================================
+# Batch Request Type
+# ============================================================================
+
+class BatchRequest(SemanticRequest):
+    """Request to run several operations in one /mg round trip.
+
+    Each entry in ops is a complete request envelope (with its own "op")
+    and is dispatched exactly as if it had been posted on its own,
+    including its audit facts. Operations run in order; by default a
+    failing operation does not stop the ones after it, and with
+    abort_on_error the batch stops at the first failure. Batches cannot
+    be nested.
+    """
+    op: Literal["batch"] = "batch"  # type: ignore[var-annotated]
+    ops: list[dict[str, Any]] = Field(
+        ...,
+        description="Request envelopes to dispatch in order",
+        min_length=1,
+        max_length=100
+    )
+    abort_on_error: bool = Field(
+        default=False,
+        description="Stop at the first failing operation; later ones are not run"
+    )
+
+
 # ============================================================================
 # Type aliases for request validation
 # ============================================================================
@@ -629,5 +657,6 @@ SemanticRequestType = (
     CommitArtifactRequest |
     GetArtifactAtCommitRequest |
     DiffCommitsRequest |
-    FoldRequest
+    FoldRequest |
+    BatchRequest
 )
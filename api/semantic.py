@@ -24,6 +24,12 @@ Session 2 implements Soil bundle verbs:
 - amend: Amend fact (create superseding fact)
 - get: Get fact by UUID (routes based on UUID prefix)
 - query: Query facts with filters (routes based on target_type)
+
+The batch op runs a list of request envelopes in one round trip:
+    {"op": "batch", "ops": [{"op": "create", ...}, {"op": "query", ...}]}
+Each entry gets its own envelope (plus HTTP-equivalent status) in
+result.results. With "abort_on_error": true the batch stops at the first
+failing entry, so result.results only covers the entries that ran.
 """
 
 import json
@@ -39,6 +45,7 @@ from api.handlers import conversation as conversation_handlers
 from api.schemas.semantic import (
     AddRequest,
     AmendRequest,
+    BatchRequest,
     CreateRequest,
     DiffCommitsRequest,
     EditRequest,
@@ -166,7 +173,7 @@ def semantic_api():
 
     Request body:
         {
-            "op": "create|get|edit|forget|query|...",
+            "op": "create|get|edit|forget|query|...|batch",
             ... (operation-specific fields)
         }
 
@@ -194,9 +201,24 @@ def semantic_api():
         )
         return jsonify(response.model_dump()), 400
 
+    response, status_code = _dispatch(request.json, actor)
+    return jsonify(response.model_dump()), status_code
+
+
+def _dispatch(request_json: dict, actor: str, allow_batch: bool = True) -> tuple[SemanticResponse, int]:
+    """Dispatch one request envelope and build its response envelope.
+
+    Args:
+        request_json: Raw request JSON dict
+        actor: Authenticated username
+        allow_batch: Whether "batch" is accepted (False for batch entries)
+
+    Returns:
+        Tuple of (response envelope, HTTP status code)
+    """
     try:
         # Validate operation is present
-        if "op" not in request.json:
+        if "op" not in request_json:
             response = SemanticResponse(
                 ok=False,
                 actor=actor,
@@ -206,13 +228,19 @@ def semantic_api():
                     "message": "Missing required field: op",
                 }
             )
-            return jsonify(response.model_dump()), 400
+            return response, 400
 
-        op = request.json["op"]
+        op = request_json["op"]
+
+        if op == "batch" and allow_batch:
+            return _dispatch_batch(BatchRequest(**request_json), actor), 200
 
         # Check if operation is supported
-        handler = _get_handler(op, request.json)
+        handler = _get_handler(op, request_json)
         if handler is None:
+            supported = set(HANDLERS.keys()) | {"get", "query"}
+            if allow_batch:
+                supported.add("batch")
             response = SemanticResponse(
                 ok=False,
                 actor=actor,
@@ -221,14 +249,18 @@ def semantic_api():
                     "type": "ValidationError",
                     "message": f"Unsupported operation: {op}",
                     "details": {
-                        "supported_operations": sorted(set(HANDLERS.keys()) | {"get", "query"}),
+                        "supported_operations": sorted(supported),
                     }
                 }
             )
-            return jsonify(response.model_dump()), 400
+            return response, 400
 
         # Validate request against appropriate schema
-        validated_request = _validate_request(request.json, op)
+        validated_request = _validate_request(request_json, op)
+
+        # Writes may change the relation graph; drop memoized explores
+        if op not in core_handlers.READ_ONLY_OPS:
+            core_handlers.clear_explore_memo()
 
         # Dispatch to handler
         result = handler(validated_request, actor)
@@ -240,13 +272,13 @@ def semantic_api():
             timestamp=isodatetime.now(),
             result=result,
         )
-        return jsonify(response.model_dump()), 200
+        return response, 200
 
     except ValidationError as e:
         # Pydantic validation error
         logger.warning(
-            f"Semantic API validation failed: op={request.json.get('op')}, "
-            f"errors={e.errors()}, received={request.json}"
+            f"Semantic API validation failed: op={request_json.get('op')}, "
+            f"errors={e.errors()}, received={request_json}"
         )
         # Convert errors to JSON-serializable format
         error_list = []
@@ -278,7 +310,7 @@ def semantic_api():
                 }
             }
         )
-        return jsonify(response.model_dump()), 400
+        return response, 400
 
     except (MemoGardenError, MGValidationError) as e:
         # MemoGarden exception - determine status code based on exception type
@@ -302,7 +334,7 @@ def semantic_api():
         )
         if e.details:
             response.error["details"] = e.details  # type: ignore
-        return jsonify(response.model_dump()), status_code
+        return response, status_code
 
     except ValueError as e:
         # Generic ValueError (e.g., unsupported entity type)
@@ -315,11 +347,11 @@ def semantic_api():
                 "message": str(e),
             }
         )
-        return jsonify(response.model_dump()), 400
+        return response, 400
 
     except Exception:
         # Unexpected error
-        logger.exception(f"Unexpected error in Semantic API: op={request.json.get('op')}")
+        logger.exception(f"Unexpected error in Semantic API: op={request_json.get('op')}")
         response = SemanticResponse(
             ok=False,
             actor=actor,
@@ -329,13 +361,75 @@ def semantic_api():
                 "message": "An unexpected error occurred",
             }
         )
-        return jsonify(response.model_dump()), 500
+        return response, 500
+
+
+def _dispatch_batch(batch: BatchRequest, actor: str) -> SemanticResponse:
+    """Dispatch each entry of a batch request in order.
+
+    Every entry goes through the normal single-op path (validation,
+    handler, audit facts), so a batch behaves like the same requests
+    posted one by one, minus the per-request HTTP and auth overhead.
+
+    Args:
+        batch: Validated BatchRequest
+        actor: Authenticated username
+
+    Returns:
+        Success envelope whose result lists one envelope per entry that
+        ran, each with the HTTP status the entry would have returned on
+        its own
+    """
+    results = []
+    for entry in batch.ops:
+        entry_response, entry_status = _dispatch(entry, actor, allow_batch=False)
+        results.append({"status": entry_status, **entry_response.model_dump()})
+        if batch.abort_on_error and not entry_response.ok:
+            break
+
+    return SemanticResponse(
+        ok=True,
+        actor=actor,
+        timestamp=isodatetime.now(),
+        result={
+            "results": results,
+            "count": len(results),
+        },
+    )
 
 
 # ============================================================================
 # Request Validation
 # ============================================================================
 
+# Map operations to request schemas (built once, consulted per request)
+REQUEST_SCHEMAS = {
+    "create": CreateRequest,
+    "get": GetRequest,
+    "edit": EditRequest,
+    "forget": ForgetRequest,
+    "query": QueryRequest,
+    "add": AddRequest,
+    "amend": AmendRequest,
+    "link": LinkRequest,
+    "unlink": UnlinkRequest,
+    "edit_relation": EditRequest,
+    "get_relation": GetRequest,
+    "query_relation": QueryRelationRequest,
+    "explore": ExploreRequest,
+    "track": TrackRequest,
+    "search": SearchRequest,
+    "enter": EnterRequest,
+    "leave": LeaveRequest,
+    "focus": FocusRequest,
+    "commit_artifact": CommitArtifactRequest,
+    "get_artifact_at_commit": GetArtifactAtCommitRequest,
+    "diff_commits": DiffCommitsRequest,
+    "fold": FoldRequest,
+    "get_conversation": GetRequest,
+}
+
+
 def _validate_request(request_json: dict, op: str) -> SemanticRequest:
     """Validate request against appropriate Pydantic schema.
 
@@ -349,34 +443,7 @@ def _validate_request(request_json: dict, op: str) -> SemanticRequest:
     Raises:
         ValidationError: If validation fails
     """
-    # Map operations to request schemas
-    request_schemas = {
-        "create": CreateRequest,
-        "get": GetRequest,
-        "edit": EditRequest,
-        "forget": ForgetRequest,
-        "query": QueryRequest,
-        "add": AddRequest,
-        "amend": AmendRequest,
-        "link": LinkRequest,
-        "unlink": UnlinkRequest,
-        "edit_relation": EditRequest,
-        "get_relation": GetRequest,
-        "query_relation": QueryRelationRequest,
-        "explore": ExploreRequest,
-        "track": TrackRequest,
-        "search": SearchRequest,
-        "enter": EnterRequest,
-        "leave": LeaveRequest,
-        "focus": FocusRequest,
-        "commit_artifact": CommitArtifactRequest,
-        "get_artifact_at_commit": GetArtifactAtCommitRequest,
-        "diff_commits": DiffCommitsRequest,
-        "fold": FoldRequest,
-        "get_conversation": GetRequest,
-    }
-
-    schema = request_schemas.get(op)
+    schema = REQUEST_SCHEMAS.get(op)
     if schema is None:
         # Fallback to base schema (shouldn't happen given HANDLERS check)
         raise ValueError(f"No request schema defined for operation: {op}")
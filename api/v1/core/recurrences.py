@@ -22,6 +22,7 @@ import logging
 from flask import Blueprint, jsonify, request
 
 from system.core import get_core
+from system.exceptions import ResourceNotFound, ValidationError
 from utils import isodatetime, recurrence
 
 from ...schemas.recurrence import RecurrenceCreate, RecurrenceUpdate
@@ -153,20 +154,49 @@ def list_recurrences():
         - valid_from: ISO 8601 datetime - Filter recurrences starting after this
         - valid_until: ISO 8601 datetime - Filter recurrences ending before this
         - include_superseded: bool - Include superseded recurrences (default: false)
+        - id: UUID - Return only this recurrence (at most one row); only
+          include_superseded may be combined with it
         - limit: int - Maximum results to return (default: 100)
         - offset: int - Number of results to skip (default: 0)
 
     Returns:
         200: Array of RecurrenceResponse objects
+        400: id combined with valid_from, valid_until, limit or offset
         401: Authentication required (if no valid auth provided)
     """
     # Parse query parameters
     valid_from = request.args.get("valid_from")
     valid_until = request.args.get("valid_until")
     include_superseded = request.args.get("include_superseded", "false").lower() == "true"
+    recurrence_id = request.args.get("id")
     limit = int(request.args.get("limit", 100))
     offset = int(request.args.get("offset", 0))
 
+    if recurrence_id:
+        # The window filters and paging are list semantics owned by
+        # core.recurrence.list(); reject them rather than silently ignore them
+        conflicting = [
+            name for name in ("valid_from", "valid_until", "limit", "offset")
+            if name in request.args
+        ]
+        if conflicting:
+            raise ValidationError(
+                "id cannot be combined with other list filters",
+                {"conflicting_params": conflicting}
+            )
+
+        # Single-row lookup by primary key instead of listing everything
+        with get_core() as core:
+            try:
+                row = core.recurrence.get_by_id(recurrence_id)
+            except ResourceNotFound:
+                return jsonify([])
+
+        response = _row_to_recurrence_response(row)
+        if response["superseded_by"] and not include_superseded:
+            return jsonify([])
+        return jsonify([response])
+
     filters = {
         "valid_from": valid_from,
         "valid_until": valid_until,
@@ -11,12 +11,14 @@ Testing Approach:
 - No mocking: Tests use real memogarden-system code
 - In-memory database: Each test gets a fresh :memory: database
 - Integration testing: Tests the full API stack
+- Parallel-safe: Databases are named in-memory SQLite databases, unique per
+  test and private to each process, so `pytest -n auto` (pytest-xdist)
+  needs no per-worker storage routing
 """
 
 import hashlib
 import os
 import sqlite3
-import tempfile
 from pathlib import Path
 from typing import Any
 from unittest.mock import patch
@@ -132,25 +134,160 @@ def _create_sqlite_connection(db_path: str) -> sqlite3.Connection:
     conn.row_factory = sqlite3.Row
     # Foreign keys disabled during schema creation, enabled afterward
     conn.execute("PRAGMA foreign_keys = OFF")
-    conn.execute("PRAGMA journal_mode = WAL")
+    # Test databases are in-memory, so there is nothing to fsync: journal_mode
+    # (WAL is a no-op there) and synchronous don't apply, and tests never rely
+    # on crash durability. Keep temporary b-trees (sorts, DISTINCT) off disk.
+    conn.execute("PRAGMA temp_store = MEMORY")
     conn.execute("PRAGMA busy_timeout = 30000")  # Wait up to 30 seconds for locks
     # Register sha256 function for migrations
     conn.create_function("sha256", 1, _sha256_hex)
     return conn
 
 
+# ============================================================================
+# Schema Template
+# ============================================================================
+
+# Authentication tables (users and api_keys) which are not in core.sql yet.
+# These will be migrated to the entity table in the future.
+_AUTH_TABLES_SQL = """
+-- Users table for authentication
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    username TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    is_admin INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+
+    FOREIGN KEY (id) REFERENCES entity(uuid) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
+
+-- API Keys table for authentication
+CREATE TABLE IF NOT EXISTS api_keys (
+    id TEXT PRIMARY KEY,
+    user_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    key_hash TEXT NOT NULL,
+    key_prefix TEXT NOT NULL,
+    expires_at TEXT,
+    created_at TEXT NOT NULL,
+    last_seen TEXT,
+    revoked_at TEXT,
+
+    FOREIGN KEY (id) REFERENCES entity(uuid) ON DELETE CASCADE,
+    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON api_keys(user_id);
+CREATE INDEX IF NOT EXISTS idx_api_keys_active ON api_keys(revoked_at) WHERE revoked_at IS NULL;
+"""
+
+
+def _read_system_schema(name: str) -> str:
+    """
+    Read a schema file from the sibling memogarden-system repository.
+
+    Args:
+        name: Schema file name (e.g. "core.sql", "soil.sql")
+
+    Returns:
+        Schema SQL text
+
+    Raises:
+        FileNotFoundError: If memogarden-system is not checked out alongside
+    """
+    project_root = Path(__file__).parent.parent.parent
+    schema_path = project_root / "memogarden-system" / "system" / "schemas" / "sql" / name
+
+    if not schema_path.exists():
+        raise FileNotFoundError(
+            f"Schema file not found at {schema_path}. "
+            f"Ensure memogarden-system repository is available."
+        )
+
+    return schema_path.read_text()
+
+
+@pytest.fixture(scope="session")
+def schema_templates():
+    """
+    Build the Core and Soil schemas once per test session.
+
+    Running core.sql and soil.sql through executescript for every test
+    dominated fixture setup. Instead, each schema is applied once to a
+    private in-memory template database, and tests restore a copy with
+    sqlite3's online backup API, which is a page copy rather than a
+    statement replay.
+
+    Returns:
+        dict with "core" and "soil" template connections
+    """
+    core_template = _create_sqlite_connection(":memory:")
+    core_template.executescript(_read_system_schema("core.sql"))
+    core_template.executescript(_AUTH_TABLES_SQL)
+    core_template.commit()
+
+    soil_template = _create_sqlite_connection(":memory:")
+    soil_template.executescript(_read_system_schema("soil.sql"))
+    soil_template.commit()
+
+    yield {"core": core_template, "soil": soil_template}
+
+    core_template.close()
+    soil_template.close()
+
+
+def _restore_template(template: sqlite3.Connection, db_path: str) -> sqlite3.Connection:
+    """
+    Copy a schema template into a fresh database.
+
+    Args:
+        template: Template connection from schema_templates
+        db_path: Destination database path or URI
+
+    Returns:
+        Open connection to the restored database (keep it open to keep a
+        named in-memory database alive)
+    """
+    conn = _create_sqlite_connection(db_path)
+    template.backup(conn)
+    return conn
+
+
 # ============================================================================
 # Flask App Fixture
 # ============================================================================
 
+@pytest.fixture(scope="session")
+def session_app():
+    """
+    Build the Flask app once per test session.
+
+    In TESTING mode create_app() does no database work, so the app (config,
+    error handlers, routes, blueprints) holds no per-test state. Handlers
+    resolve their Core/Soil connections per request, which is what
+    flask_app patches for each test.
+
+    Returns:
+        Flask app instance configured for testing
+    """
+    from api.main import create_app
+
+    return create_app(test_config={"TESTING": True})
+
+
 @pytest.fixture(scope="function")
-def flask_app():
+def flask_app(schema_templates, session_app):
     """
-    Create a Flask app for testing.
+    Provide the session Flask app bound to fresh per-test databases.
 
     Each test gets a fresh in-memory SQLite database for perfect isolation.
-    The database is initialized with the full schema on startup.
+    The database is restored from the session schema template on startup.
     Database is automatically cleaned up when the test completes.
+    The app object itself is shared (see session_app); only the database
+    patches are per test.
 
     Session 5 Fix: Switched from shared temp file to in-memory database to:
     - Eliminate database locking issues in concurrent test execution
@@ -161,16 +298,14 @@ def flask_app():
     Returns:
         Flask app instance configured for testing
     """
-    import threading
     import uuid
 
-    _schema_initialized = False
-    _schema_lock = threading.Lock()
-    _keeper_conn = None  # Keep this connection alive to prevent database destruction
     # Use unique database name for each test to ensure isolation
     _test_db_name = f"file:memogarden_test_{uuid.uuid4()}?mode=memory&cache=shared"
 
-    # Now import and configure the app
+    # Keep this connection alive to prevent database destruction
+    _keeper_conn = _restore_template(schema_templates["core"], _test_db_name)
+
     # Patch _create_connection to use our test database
     def _mock_create_connection():
         """Mock that returns our in-memory test database connection.
@@ -181,89 +316,12 @@ def flask_app():
         Session 5: Using named in-memory database to allow multiple connections
         while avoiding issues with Flask app initialization closing connections.
         """
-        nonlocal _schema_initialized, _keeper_conn
-
-        # Use named shared in-memory database
-        conn = _create_sqlite_connection(_test_db_name)
-
-        # Initialize schema on first connection (with locking to prevent race conditions)
-        with _schema_lock:
-            if not _schema_initialized:
-                # Load schema from the memogarden-system core.sql file
-                from pathlib import Path
-
-                tests_dir = Path(__file__).parent
-                project_root = tests_dir.parent.parent
-                schema_path = project_root / "memogarden-system" / "system" / "schemas" / "sql" / "core.sql"
-
-                if not schema_path.exists():
-                    raise FileNotFoundError(
-                        f"Schema file not found at {schema_path}. "
-                        f"Ensure memogarden-system repository is available."
-                    )
-
-                final_schema_sql = schema_path.read_text()
-                conn.executescript(final_schema_sql)
-
-                # Add authentication tables (users and api_keys)
-                auth_tables_sql = """
-                CREATE TABLE IF NOT EXISTS users (
-                    id TEXT PRIMARY KEY,
-                    username TEXT UNIQUE NOT NULL,
-                    password_hash TEXT NOT NULL,
-                    is_admin INTEGER NOT NULL DEFAULT 0,
-                    created_at TEXT NOT NULL,
-                    FOREIGN KEY (id) REFERENCES entity(uuid) ON DELETE CASCADE
-                );
-                CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
-
-                CREATE TABLE IF NOT EXISTS api_keys (
-                    id TEXT PRIMARY KEY,
-                    user_id TEXT NOT NULL,
-                    name TEXT NOT NULL,
-                    key_hash TEXT NOT NULL,
-                    key_prefix TEXT NOT NULL,
-                    expires_at TEXT,
-                    created_at TEXT NOT NULL,
-                    last_seen TEXT,
-                    revoked_at TEXT,
-                    FOREIGN KEY (id) REFERENCES entity(uuid) ON DELETE CASCADE,
-                    FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-                );
-                CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON api_keys(user_id);
-                CREATE INDEX IF NOT EXISTS idx_api_keys_active ON api_keys(revoked_at) WHERE revoked_at IS NULL;
-                """
-                conn.executescript(auth_tables_sql)
-                conn.commit()
-
-                # Store this connection as the keeper to keep database alive
-                _keeper_conn = conn
-                _schema_initialized = True
-
-                # Return a NEW connection (not the keeper) so Flask app can close it without destroying the database
-                return _create_sqlite_connection(_test_db_name)
-
-        # For subsequent calls, return new connections
-        return conn
+        return _create_sqlite_connection(_test_db_name)
 
     # Initialize Soil database for tests
     # Use named shared in-memory database with unique name (Session 5: fixed to use shared cache)
     soil_db_name = f"file:memogarden_soil_{uuid.uuid4()}?mode=memory&cache=shared"
-    soil_conn = _create_sqlite_connection(soil_db_name)
-    from pathlib import Path
-    tests_dir = Path(__file__).parent
-    project_root = tests_dir.parent.parent
-    soil_schema_path = project_root / "memogarden-system" / "system" / "schemas" / "sql" / "soil.sql"
-
-    if not soil_schema_path.exists():
-        raise FileNotFoundError(
-            f"Soil schema file not found at {soil_schema_path}. "
-            f"Ensure memogarden-system repository is available."
-        )
-
-    soil_schema_sql = soil_schema_path.read_text()
-    soil_conn.executescript(soil_schema_sql)
-    soil_conn.commit()
+    soil_conn = _restore_template(schema_templates["soil"], soil_db_name)
 
     # Save original Soil.__init__ before patching
     from system.soil.database import Soil
@@ -275,22 +333,17 @@ def flask_app():
         # Always use named shared in-memory test database, ignore the passed db_path
         original_soil_init(self, soil_db_name)
 
-    # Patch _create_connection BEFORE importing the app
+    # Patch _create_connection for the duration of the test
     with patch('system.core._create_connection', _mock_create_connection):
         # Patch Soil.__init__ to use test database
         with patch.object(Soil, '__init__', _mock_soil_init):
-            from api.main import create_app
-
-            app = create_app(test_config={"TESTING": True})
-
-            yield app
+            yield session_app
 
         # Cleanup soil connection (in-memory database auto-cleans)
         soil_conn.close()
 
     # Cleanup keeper connection (in-memory database auto-cleans)
-    if _keeper_conn is not None:
-        _keeper_conn.close()
+    _keeper_conn.close()
 
 
 @pytest.fixture
@@ -311,86 +364,30 @@ def client(flask_app):
 # ============================================================================
 
 @pytest.fixture
-def db_conn():
+def db_conn(schema_templates):
     """
     Create a fresh database connection for direct database access.
 
     Useful for setting up test data or verifying database state.
 
+    Uses a uniquely named in-memory database (like flask_app), so no temp
+    file is created, synced or unlinked per test.
+
     Returns:
         SQLite connection with row_factory set to sqlite3.Row
     """
-    # Use temp file database for this fixture
-    import tempfile
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
+    import uuid
 
-    conn = _create_sqlite_connection(db_path)
+    db_path = f"file:memogarden_direct_{uuid.uuid4()}?mode=memory&cache=shared"
 
-    # Load schema from the memogarden-system core.sql file
+    # Restore the Core schema (plus auth tables) from the session template.
     # This ensures tests always match production schema
-    from pathlib import Path
-
-    # Find the core.sql file in memogarden-system
-    tests_dir = Path(__file__).parent
-    project_root = tests_dir.parent.parent
-    schema_path = project_root / "memogarden-system" / "system" / "schemas" / "sql" / "core.sql"
+    conn = _restore_template(schema_templates["core"], db_path)
 
-    if not schema_path.exists():
-        raise FileNotFoundError(
-            f"Schema file not found at {schema_path}. "
-            f"Ensure memogarden-system repository is available."
-        )
-
-    final_schema_sql = schema_path.read_text()
-    conn.executescript(final_schema_sql)
-
-    # Add authentication tables (users and api_keys) which are not in core.sql yet
-    # These will be migrated to the entity table in the future
-    auth_tables_sql = """
-    -- Users table for authentication
-    CREATE TABLE IF NOT EXISTS users (
-        id TEXT PRIMARY KEY,
-        username TEXT UNIQUE NOT NULL,
-        password_hash TEXT NOT NULL,
-        is_admin INTEGER NOT NULL DEFAULT 0,
-        created_at TEXT NOT NULL,
-
-        FOREIGN KEY (id) REFERENCES entity(uuid) ON DELETE CASCADE
-    );
-
-    CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
-
-    -- API Keys table for authentication
-    CREATE TABLE IF NOT EXISTS api_keys (
-        id TEXT PRIMARY KEY,
-        user_id TEXT NOT NULL,
-        name TEXT NOT NULL,
-        key_hash TEXT NOT NULL,
-        key_prefix TEXT NOT NULL,
-        expires_at TEXT,
-        created_at TEXT NOT NULL,
-        last_seen TEXT,
-        revoked_at TEXT,
-
-        FOREIGN KEY (id) REFERENCES entity(uuid) ON DELETE CASCADE,
-        FOREIGN KEY (user_id) REFERENCES users(id) ON DELETE CASCADE
-    );
-
-    CREATE INDEX IF NOT EXISTS idx_api_keys_user_id ON api_keys(user_id);
-    CREATE INDEX IF NOT EXISTS idx_api_keys_active ON api_keys(revoked_at) WHERE revoked_at IS NULL;
-    """
-    conn.executescript(auth_tables_sql)
-    conn.commit()
-
-    temp_db_path = db_path  # Store for cleanup
     yield conn
 
+    # Closing the only connection releases the in-memory database
     conn.close()
-    try:
-        os.unlink(temp_db_path)
-    except OSError:
-        pass  # Ignore cleanup failures in tests
 
 
 # ============================================================================
@@ -403,6 +400,18 @@ from api.config import settings  # noqa: E402 (must import after db fixtures)
 # This reduces per-test auth fixture time from ~300ms to ~20ms
 settings.bcrypt_work_factor = 4
 
+# Fixed identity for the app-database test user. Every test gets a fresh
+# database, so a stable id never collides and lets the JWT be minted once.
+TEST_USER_ID = "00000000-0000-4000-8000-000000000001"
+TEST_USERNAME = "testuser"
+TEST_PASSWORD = "TestPass123"
+
+# bcrypt is slow by design, so hash the shared test password once at import
+# (after the work factor override above) instead of once per test.
+from api.middleware.service import hash_password  # noqa: E402
+
+TEST_PASSWORD_HASH = hash_password(TEST_PASSWORD)
+
 
 @pytest.fixture
 def test_user(db_conn):
@@ -418,12 +427,10 @@ def test_user(db_conn):
     import json
     import uuid
 
-    from api.middleware.service import hash_password
-
     user_id = str(uuid.uuid4())
-    username = "testuser"
-    password = "TestPass123"
-    password_hash = hash_password(password)  # Use default work factor
+    username = TEST_USERNAME
+    password = TEST_PASSWORD
+    password_hash = TEST_PASSWORD_HASH
 
     now = isodatetime.now()
 
@@ -464,16 +471,14 @@ def test_user_app(flask_app):
         dict with user data: id, username, password (plaintext), is_admin, created_at
     """
     import json
-    import uuid
 
-    from api.middleware.service import hash_password
     from system.core import _create_connection
     from utils import hash_chain
 
-    user_id = str(uuid.uuid4())
-    username = "testuser"
-    password = "TestPass123"
-    password_hash = hash_password(password)  # Use default work factor
+    user_id = TEST_USER_ID
+    username = TEST_USERNAME
+    password = TEST_PASSWORD
+    password_hash = TEST_PASSWORD_HASH
 
     now = isodatetime.now()
 
@@ -534,26 +539,59 @@ def _create_jwt_token(user_id: str, username: str, is_admin: bool = True) -> str
     return token
 
 
+@pytest.fixture(scope="session")
+def auth_token():
+    """
+    Mint a JWT for the fixed test user once per test session.
+
+    The token only depends on the test user's identity, which is stable
+    across tests (see TEST_USER_ID), so signing it per test is wasted work.
+    Its 30-day expiry comfortably outlives any test run.
+
+    Returns:
+        Encoded JWT access token string
+    """
+    return _create_jwt_token(TEST_USER_ID, TEST_USERNAME, is_admin=True)
+
+
 @pytest.fixture
-def auth_headers(test_user_app):
+def auth_headers(test_user_app, auth_token):
     """
     Create authentication headers for API requests.
 
-    Returns headers with JWT token for the test_user.
+    Returns headers with JWT token for the test_user. Depends on
+    test_user_app so the user row exists in this test's database.
 
     Returns:
         dict with Authorization header for JWT authentication
     """
-    token = _create_jwt_token(test_user_app["id"], test_user_app["username"], test_user_app["is_admin"])
-
     return {
-        "Authorization": f"Bearer {token}",
+        "Authorization": f"Bearer {auth_token}",
         "Content-Type": "application/json",
     }
 
 
+@pytest.fixture(scope="session")
+def api_key_material():
+    """
+    Generate and hash the test API key once per test session.
+
+    hash_api_key() is bcrypt, so hashing per test dominated
+    auth_headers_apikey. The key row itself still has to be inserted into
+    each test's fresh database (see auth_headers_apikey).
+
+    Returns:
+        Tuple of (raw_key, key_hash, key_prefix)
+    """
+    from api.middleware.api_keys import get_api_key_prefix, hash_api_key
+    from utils import secret
+
+    raw_key = secret.generate_api_key()
+    return raw_key, hash_api_key(raw_key), get_api_key_prefix(raw_key)
+
+
 @pytest.fixture
-def auth_headers_apikey(test_user_app):
+def auth_headers_apikey(test_user_app, api_key_material):
     """
     Create authentication headers with API key for API requests.
 
@@ -565,15 +603,11 @@ def auth_headers_apikey(test_user_app):
     import json
     import uuid
 
-    from api.middleware.api_keys import get_api_key_prefix, hash_api_key
     from system.core import _create_connection
-    from utils import hash_chain, secret
+    from utils import hash_chain
 
-    # Generate API key
     api_key_id = str(uuid.uuid4())
-    raw_key = secret.generate_api_key()
-    key_hash = hash_api_key(raw_key)
-    key_prefix = get_api_key_prefix(raw_key)
+    raw_key, key_hash, key_prefix = api_key_material
 
     now = isodatetime.now()
 
@@ -660,6 +694,121 @@ def sample_recurrence_data():
     }
 
 
+@pytest.fixture
+def dispatch_verb(flask_app):
+    """
+    Run one /mg operation in-process, skipping the HTTP round trip.
+
+    For arrange phases: calls the Semantic API dispatcher directly as the
+    test user, without building a request, running auth middleware or
+    encoding JSON. The verb under test should still go through client.post.
+
+    Returns:
+        Callable taking a request envelope dict and returning its result
+        dict (asserts the operation succeeded)
+    """
+    from api.semantic import _dispatch
+
+    def _dispatch_verb(payload: dict) -> dict:
+        with flask_app.test_request_context():
+            response, status = _dispatch(payload, TEST_USERNAME)
+        assert status == 200, response.error
+        return response.result
+
+    return _dispatch_verb
+
+
+# Enough Artifacts for the largest explore graph (one source, five targets)
+ARTIFACT_POOL_SIZE = 6
+
+
+@pytest.fixture
+def artifact_pool(flask_app):
+    """
+    Seed a pool of Artifacts directly through Core for graph tests.
+
+    All Artifacts are created in one get_core() transaction instead of one
+    /mg create per node. Tests slice the pool for the graph shape they need.
+
+    Function-scoped on purpose: every test starts from a fresh database
+    (see flask_app), so a session-wide pool would not survive into the
+    next test, and relations linked by one test never leak into another.
+
+    Returns:
+        List of ARTIFACT_POOL_SIZE core_-prefixed Artifact UUIDs
+    """
+    from system.core import get_core
+    from utils import uid
+
+    with get_core() as core:
+        return [
+            uid.add_core_prefix(core.entity.create(entity_type="Artifact", data={"name": f"Node{i}"}))
+            for i in range(ARTIFACT_POOL_SIZE)
+        ]
+
+
+def _make_relation(core, source: str, target: str, **kwargs) -> str:
+    """Create an entity-to-entity relation with the link verb's defaults.
+
+    Keyword arguments override the defaults passed to core.relation.create().
+
+    Returns:
+        core_-prefixed relation UUID
+    """
+    from utils import uid
+
+    return uid.add_core_prefix(core.relation.create(**{
+        "kind": "explicit_link",
+        "source": source,
+        "source_type": "entity",
+        "target": target,
+        "target_type": "entity",
+        "initial_horizon_days": 7,
+        "evidence": None,
+        "metadata": None,
+        **kwargs,
+    }))
+
+
+@pytest.fixture
+def make_relation(flask_app):
+    """
+    Create one relation directly through Core.
+
+    For arrange phases only; the verb under test should still go through
+    /mg.
+
+    Returns:
+        Callable taking (source, target, **kwargs) and returning the
+        core_-prefixed relation UUID
+    """
+    from system.core import get_core
+
+    def _make(source: str, target: str, **kwargs) -> str:
+        with get_core() as core:
+            return _make_relation(core, source, target, **kwargs)
+
+    return _make
+
+
+@pytest.fixture
+def bulk_link(flask_app):
+    """
+    Link several entity pairs directly through Core in one transaction.
+
+    Returns:
+        Callable taking a list of (source, target) UUID pairs and returning
+        the core_-prefixed relation UUIDs in order
+    """
+    from system.core import get_core
+
+    def _link(pairs: list[tuple[str, str]]) -> list[str]:
+        with get_core() as core:
+            return [_make_relation(core, source, target) for source, target in pairs]
+
+    return _link
+
+
 # ============================================================================
 # Core Database Fixture
 # ============================================================================
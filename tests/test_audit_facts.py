@@ -10,64 +10,150 @@ Tests the Action and ActionResult fact creation per RFC-005 v7 Section 7:
 import pytest
 from system.soil import get_soil
 from system.soil.fact import generate_soil_uuid
+from utils import isodatetime
+
+# Shared Transaction fields; call sites override amount (and labels) per case
+_TX_TEMPLATE = {
+    "date": "2026-02-08",
+    "currency": "USD",
+    "account": "Test",
+    "category": "Test",
+}
+
+
+def _items_of_type(soil, item_type):
+    """Yield Soil items of a single type.
+
+    Soil.list_items() takes no type filter, so this still reads the whole
+    store; it streams matches instead of building a list, letting callers
+    that count or pick one item skip the intermediate copy.
+    """
+    return (item for item in soil.list_items() if item._type == item_type)
+
+
+def _latest(items, predicate=None):
+    """Return the most recently realized item matching predicate, or None.
+
+    Compares parsed realized_at datetimes, not their string forms, so
+    differing offsets or precision cannot misorder items. Items realized
+    at the same instant are ordered by their position in items, so the
+    tie goes to the one listed last.
+    """
+    candidates = (
+        (isodatetime.to_datetime(item.realized_at), position, item)
+        for position, item in enumerate(items)
+        if predicate is None or predicate(item)
+    )
+    latest = max(candidates, key=lambda candidate: candidate[:2], default=None)
+    return latest[2] if latest is not None else None
+
+
+def _find_action(actions, operation, target):
+    """Return the first Action for operation on params.target, or None.
+
+    Stops at the first match instead of scanning every Action.
+    """
+    return next(
+        (
+            action for action in actions
+            if action.data.get("operation") == operation
+            and isinstance(action.data.get("params"), dict)
+            and action.data["params"].get("target") == target
+        ),
+        None,
+    )
+
+
+def _find_result_of(soil, action, results_by_uuid):
+    """Return the ActionResult linked to action by a result_of relation, or None.
+
+    Hash join: walks relations lazily, stops at the first one targeting
+    action, then resolves its source through results_by_uuid.
+
+    Args:
+        soil: Open Soil instance
+        action: Action fact to resolve
+        results_by_uuid: ActionResult facts keyed by uuid
+    """
+    relation = next(
+        (r for r in soil.get_relations(kind="result_of") if r.target == action.uuid),
+        None,
+    )
+    if relation is None:
+        return None
+    return results_by_uuid.get(relation.source)
 
 
 class TestAuditFacts:
     """Test audit fact creation for Semantic API operations."""
 
-    def test_create_operation_creates_audit_facts(self, client, auth_headers):
-        """Test that create operation creates Action and ActionResult facts."""
-        # Create a transaction via Semantic API
+    @pytest.fixture
+    def seeded_transaction(self, client, auth_headers):
+        """Create a Transaction via the Semantic API and return its core_ UUID."""
         response = client.post(
             "/mg",
             json={
                 "op": "create",
                 "type": "Transaction",
-                "data": {
-                    "date": "2026-02-08",
-                    "amount": 42.50,
-                    "currency": "USD",
-                    "account": "Test Account",
-                    "category": "Test Category",
-                }
+                "data": {**_TX_TEMPLATE, "amount": 100.00}
             },
             headers=auth_headers
         )
+        assert response.status_code == 200
+        return response.get_json()["result"]["uuid"]
 
-        # Debug: print response if not successful
-        if response.status_code != 200:
-            print(f"ERROR: Status {response.status_code}")
-            print(f"Response: {response.get_json()}")
+    @pytest.mark.parametrize("payload, expected_op", [
+        (
+            {
+                "op": "create",
+                "type": "Transaction",
+                "data": {**_TX_TEMPLATE, "amount": 42.50, "account": "Test Account"}
+            },
+            "create",
+        ),
+        ({"op": "get"}, "get"),
+        ({"op": "query", "target_type": "entity", "type": "Transaction"}, "query"),
+    ])
+    def test_operation_creates_audit_facts(
+        self, client, auth_headers, seeded_transaction, payload, expected_op
+    ):
+        """Test that create/get/query operations create Action and ActionResult facts."""
+        if expected_op == "get":
+            payload = {**payload, "target": seeded_transaction}
+
+        # Snapshot audit facts left behind by the seeding request
+        with get_soil() as soil:
+            seen = {
+                item.uuid
+                for item_type in ("Action", "ActionResult")
+                for item in _items_of_type(soil, item_type)
+            }
+
+        response = client.post("/mg", json=payload, headers=auth_headers)
 
-        # Check response is successful
         assert response.status_code == 200
         data = response.get_json()
         assert data["ok"] is True
 
-        # Get Soil instance and query for audit facts
         with get_soil() as soil:
-            # Query for Action facts
-            all_items = soil.list_items()
-            action_items = [i for i in all_items if i._type == "Action"]
-            assert len(action_items) == 1
-            action = action_items[0]
+            action_items = [a for a in _items_of_type(soil, "Action") if a.uuid not in seen]
+            actionresult_items = [
+                ar for ar in _items_of_type(soil, "ActionResult") if ar.uuid not in seen
+            ]
 
             # Verify Action fact structure
-            assert action._type == "Action"
-            assert action.data["operation"] == "create"
+            assert len(action_items) == 1
+            action = action_items[0]
+            assert action.data["operation"] == expected_op
             assert "actor" in action.data
             assert "params" in action.data
             assert "request_id" in action.data
-            assert action.data["params"]["type"] == "Transaction"
-            assert action.data["params"]["data"]["amount"] == 42.50
+            assert action.canonical_at == action.realized_at
 
-            # Query for ActionResult facts
-            actionresult_items = [i for i in all_items if i._type == "ActionResult"]
+            # Verify ActionResult fact structure
             assert len(actionresult_items) == 1
             actionresult = actionresult_items[0]
-
-            # Verify ActionResult fact structure
-            assert actionresult._type == "ActionResult"
+            assert actionresult.canonical_at == actionresult.realized_at
             assert actionresult.data["status"] == "success"
             assert "duration_ms" in actionresult.data
             assert actionresult.data["duration_ms"] >= 0
@@ -80,98 +166,6 @@ class TestAuditFacts:
             assert relations[0].target == action.uuid
             assert relations[0].kind == "result_of"
 
-    def test_get_operation_creates_audit_facts(self, client, auth_headers):
-        """Test that get operation creates audit facts."""
-        # First create a transaction
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Transaction",
-                "data": {
-                    "date": "2026-02-08",
-                    "amount": 100.00,
-                    "currency": "USD",
-                    "account": "Test",
-                    "category": "Test",
-                }
-            },
-            headers=auth_headers
-        )
-        assert create_response.status_code == 200
-        transaction_data = create_response.get_json()["result"]
-        transaction_uuid = transaction_data["uuid"]
-
-        # Now get the transaction
-        response = client.post(
-            "/mg",
-            json={
-                "op": "get",
-                "target": transaction_uuid
-            },
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data["ok"] is True
-
-        # Verify audit facts were created
-        with get_soil() as soil:
-            action_items = [a for a in soil.list_items() if a._type == "Action"]
-            get_actions = [a for a in action_items if a.data.get("operation") == "get"]
-            assert len(get_actions) >= 1
-            assert get_actions[-1].data["operation"] == "get"
-
-            actionresult_items = [ar for ar in soil.list_items() if ar._type == "ActionResult"]
-            assert len(actionresult_items) >= 1
-            get_results = [ar for ar in actionresult_items if ar.data.get("result_summary", "").startswith("get")]
-            assert len(get_results) >= 1
-
-    def test_query_operation_creates_audit_facts(self, client, auth_headers):
-        """Test that query operation creates audit facts."""
-        # First create some test data
-        client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Transaction",
-                "data": {
-                    "date": "2026-02-08",
-                    "amount": 100.00,
-                    "currency": "USD",
-                    "account": "Test",
-                    "category": "Test",
-                }
-            },
-            headers=auth_headers
-        )
-
-        # Clear previous audit facts
-        with get_soil() as soil:
-            previous_actions = len([i for i in soil.list_items() if i._type == "Action"])
-
-        # Query transactions
-        response = client.post(
-            "/mg",
-            json={
-                "op": "query",
-                "target_type": "entity",
-                "type": "Transaction",
-            },
-            headers=auth_headers
-        )
-
-        assert response.status_code == 200
-
-        # Verify audit facts were created
-        with get_soil() as soil:
-            action_items = [i for i in soil.list_items() if i._type == "Action"]
-            assert len(action_items) == previous_actions + 1
-            # Find the query action (most recent by realized_at)
-            query_actions = [a for a in action_items if a.data.get("operation") == "query"]
-            assert len(query_actions) >= 1
-
     def test_audit_facts_on_error(self, client, auth_headers):
         """Test that audit facts are created even when operation fails."""
         # Try to get a non-existent entity
@@ -190,35 +184,14 @@ class TestAuditFacts:
 
         # Verify audit facts were still created
         with get_soil() as soil:
-            action_items = [i for i in soil.list_items() if i._type == "Action"]
-            assert len(action_items) >= 1
-
             # Find the failed get action
-            failed_get = None
-            for action in action_items:
-                if action.data.get("operation") == "get":
-                    params = action.data.get("params", {})
-                    if isinstance(params, dict) and params.get("target") == fake_uuid:
-                        failed_get = action
-                        break
+            failed_get = _find_action(_items_of_type(soil, "Action"), "get", fake_uuid)
 
             assert failed_get is not None, "Action fact for failed get not found"
 
-            # Verify ActionResult with error status
-            actionresult_items = [i for i in soil.list_items() if i._type == "ActionResult"]
-            assert len(actionresult_items) >= 1
-
             # Find ActionResult for this failed action
-            failed_result = None
-            relations = soil.get_relations(kind="result_of")
-            for relation in relations:
-                if relation.target == failed_get.uuid:
-                    # Find the ActionResult
-                    for ar in actionresult_items:
-                        if ar.uuid == relation.source:
-                            failed_result = ar
-                            break
-                break
+            results_by_uuid = {ar.uuid: ar for ar in _items_of_type(soil, "ActionResult")}
+            failed_result = _find_result_of(soil, failed_get, results_by_uuid)
 
             assert failed_result is not None, "ActionResult for failed get not found"
             assert failed_result.data["status"] == "error"
@@ -237,20 +210,14 @@ class TestAuditFacts:
             json={
                 "op": "create",
                 "type": "Transaction",
-                "data": {
-                    "date": "2026-02-08",
-                    "amount": 50.00,
-                    "currency": "USD",
-                    "account": "Test",
-                    "category": "Test",
-                }
+                "data": {**_TX_TEMPLATE, "amount": 50.00}
             },
             headers=auth_headers
         )
         assert response1.status_code == 200
 
         with get_soil() as soil:
-            action_count_with_audit = len([i for i in soil.list_items() if i._type == "Action"])
+            action_count_with_audit = sum(1 for _ in _items_of_type(soil, "Action"))
 
         # Create entity with audit logging disabled
         response2 = client.post(
@@ -258,13 +225,7 @@ class TestAuditFacts:
             json={
                 "op": "create",
                 "type": "Transaction",
-                "data": {
-                    "date": "2026-02-08",
-                    "amount": 75.00,
-                    "currency": "USD",
-                    "account": "Test",
-                    "category": "Test",
-                },
+                "data": {**_TX_TEMPLATE, "amount": 75.00},
                 "bypass_semantic_api": True
             },
             headers=auth_headers
@@ -273,7 +234,7 @@ class TestAuditFacts:
 
         # Verify no new Action fact was created
         with get_soil() as soil:
-            action_count_bypass = len([i for i in soil.list_items() if i._type == "Action"])
+            action_count_bypass = sum(1 for _ in _items_of_type(soil, "Action"))
         assert action_count_with_audit == action_count_bypass
 
     def test_multiple_operations_create_distinct_audit_facts(self, client, auth_headers):
@@ -283,12 +244,12 @@ class TestAuditFacts:
             {
                 "op": "create",
                 "type": "Transaction",
-                "data": {"date": "2026-02-08", "amount": 10.00, "currency": "USD", "account": "A", "category": "C"}
+                "data": {**_TX_TEMPLATE, "amount": 10.00, "account": "A", "category": "C"}
             },
             {
                 "op": "create",
                 "type": "Transaction",
-                "data": {"date": "2026-02-08", "amount": 20.00, "currency": "USD", "account": "B", "category": "D"}
+                "data": {**_TX_TEMPLATE, "amount": 20.00, "account": "B", "category": "D"}
             },
             {
                 "op": "query",
@@ -297,22 +258,23 @@ class TestAuditFacts:
             }
         ]
 
-        for op in operations:
-            response = client.post("/mg", json=op, headers=auth_headers)
-            assert response.status_code == 200
+        response = client.post("/mg", json={"op": "batch", "ops": operations}, headers=auth_headers)
+        assert response.status_code == 200
+        assert [r["status"] for r in response.get_json()["result"]["results"]] == [200, 200, 200]
 
         # Verify distinct Action facts with unique request IDs
         with get_soil() as soil:
-            action_items = [i for i in soil.list_items() if i._type == "Action"]
-            assert len(action_items) >= 3
-
-            # Extract request IDs
-            request_ids = [action.data.get("request_id") for action in action_items]
-            # Filter out None values (in case of any)
-            request_ids = [rid for rid in request_ids if rid is not None]
-
-            # Verify all request IDs are unique
-            assert len(request_ids) == len(set(request_ids)), "All request IDs should be unique"
+            # Verify all request IDs are unique, failing on the first duplicate
+            action_count = 0
+            seen_request_ids = set()
+            for action in _items_of_type(soil, "Action"):
+                action_count += 1
+                rid = action.data.get("request_id")
+                if rid is None:
+                    continue
+                assert rid not in seen_request_ids, f"Duplicate request ID: {rid}"
+                seen_request_ids.add(rid)
+            assert action_count >= 3
 
     def test_audit_fact_params_serialization(self, client, auth_headers):
         """Test that audit facts properly serialize request parameters."""
@@ -322,11 +284,8 @@ class TestAuditFacts:
                 "op": "create",
                 "type": "Transaction",
                 "data": {
-                    "date": "2026-02-08",
+                    **_TX_TEMPLATE,
                     "amount": 99.99,
-                    "currency": "USD",
-                    "account": "Test Account",
-                    "category": "Test Category",
                     "notes": "This is a test transaction with special chars: <>&\"'",
                 }
             },
@@ -337,13 +296,13 @@ class TestAuditFacts:
 
         # Verify params are serialized correctly
         with get_soil() as soil:
-            action_items = [i for i in soil.list_items() if i._type == "Action"]
-            assert len(action_items) >= 1
-
             # Find the create action (most recent with amount 99.99)
-            create_actions = [a for a in action_items if a.data.get("operation") == "create" and a.data.get("params", {}).get("data", {}).get("amount") == 99.99]
-            assert len(create_actions) >= 1
-            action = create_actions[-1]
+            action = _latest(
+                _items_of_type(soil, "Action"),
+                lambda a: a.data.get("operation") == "create"
+                and a.data.get("params", {}).get("data", {}).get("amount") == 99.99,
+            )
+            assert action is not None
             params = action.data.get("params", {})
             assert isinstance(params, dict)
             assert params["type"] == "Transaction"
@@ -369,14 +328,10 @@ class TestAuditFacts:
 
         # Get the latest Action and ActionResult
         with get_soil() as soil:
-            actions = [i for i in soil.list_items() if i._type == "Action"]
-            results = [i for i in soil.list_items() if i._type == "ActionResult"]
-
-            assert len(actions) >= 1
-            assert len(results) >= 1
-
-            latest_action = actions[-1]
-            latest_result = results[-1]
+            latest_action = _latest(_items_of_type(soil, "Action"))
+            latest_result = _latest(_items_of_type(soil, "ActionResult"))
+            assert latest_action is not None
+            assert latest_result is not None
 
             # Get the result_of relation
             relations = soil.get_relations(source=latest_result.uuid, kind="result_of")
@@ -419,29 +374,13 @@ class TestStructuredErrorCapture:
         # Verify structured error in ActionResult
         with get_soil() as soil:
             # Find the failed action
-            action_items = [i for i in soil.list_items() if i._type == "Action"]
-            failed_get = None
-            for action in action_items:
-                if action.data.get("operation") == "get":
-                    params = action.data.get("params", {})
-                    if isinstance(params, dict) and params.get("target") == fake_uuid:
-                        failed_get = action
-                        break
+            failed_get = _find_action(_items_of_type(soil, "Action"), "get", fake_uuid)
+            results_by_uuid = {ar.uuid: ar for ar in _items_of_type(soil, "ActionResult")}
 
             assert failed_get is not None, "Action fact for failed get not found"
 
             # Find the ActionResult
-            actionresult_items = [i for i in soil.list_items() if i._type == "ActionResult"]
-            relations = soil.get_relations(kind="result_of")
-            failed_result = None
-            for relation in relations:
-                if relation.target == failed_get.uuid:
-                    for ar in actionresult_items:
-                        if ar.uuid == relation.source:
-                            failed_result = ar
-                            break
-                if failed_result:
-                    break
+            failed_result = _find_result_of(soil, failed_get, results_by_uuid)
 
             assert failed_result is not None
             assert failed_result.data["status"] == "error"
@@ -563,11 +502,11 @@ class TestStructuredErrorCapture:
 
         # Verify error details in ActionResult
         with get_soil() as soil:
-            actionresult_items = [i for i in soil.list_items() if i._type == "ActionResult"]
-            error_results = [ar for ar in actionresult_items if ar.data.get("status") == "error"]
-            assert len(error_results) >= 1
-
-            latest_error = error_results[-1]
+            latest_error = _latest(
+                _items_of_type(soil, "ActionResult"),
+                lambda ar: ar.data.get("status") == "error",
+            )
+            assert latest_error is not None
             error = latest_error.data["error"]
 
             # error.details may or may not be present depending on exception type
@@ -582,13 +521,7 @@ class TestStructuredErrorCapture:
             json={
                 "op": "create",
                 "type": "Transaction",
-                "data": {
-                    "date": "2026-02-08",
-                    "amount": 100.00,
-                    "currency": "USD",
-                    "account": "Test",
-                    "category": "Test",
-                }
+                "data": {**_TX_TEMPLATE, "amount": 100.00}
             },
             headers=auth_headers
         )
@@ -597,10 +530,10 @@ class TestStructuredErrorCapture:
 
         # Verify error is null for successful operations
         with get_soil() as soil:
-            actionresult_items = [i for i in soil.list_items() if i._type == "ActionResult"]
-            success_results = [ar for ar in actionresult_items if ar.data.get("status") == "success"]
-            assert len(success_results) >= 1
-
-            latest_success = success_results[-1]
+            latest_success = _latest(
+                _items_of_type(soil, "ActionResult"),
+                lambda ar: ar.data.get("status") == "success",
+            )
+            assert latest_success is not None
             assert latest_success.data["error"] is None
             assert latest_success.data["result"] is not None
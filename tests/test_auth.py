@@ -7,7 +7,14 @@ Tests cover:
 - GET  /auth/me             - Get current user profile
 """
 
-import json
+ADMIN_DATA = {"username": "admin", "password": "SecurePass123"}
+
+# Each entry violates exactly one password rule
+WEAK_PASSWORD_REGISTRATIONS = (
+    {"username": "admin2", "password": "NoDigits"},  # no digit
+    {"username": "admin3", "password": "12345678"},  # no letter
+    {"username": "admin4", "password": "Short1"},  # too short
+)
 
 
 def test_health_check(client):
@@ -24,15 +31,9 @@ def test_admin_registration(client):
     import os
     os.environ["BYPASS_LOCALHOST_CHECK"] = "true"
 
-    admin_data = {
-        "username": "admin",
-        "password": "SecurePass123"
-    }
-
     response = client.post(
         "/admin/register",
-        data=json.dumps(admin_data),
-        content_type="application/json"
+        json=ADMIN_DATA
     )
 
     assert response.status_code in (200, 201)
@@ -47,24 +48,17 @@ def test_admin_registration_duplicate(client):
     import os
     os.environ["BYPASS_LOCALHOST_CHECK"] = "true"
 
-    admin_data = {
-        "username": "admin",
-        "password": "SecurePass123"
-    }
-
     # First registration should succeed
     response = client.post(
         "/admin/register",
-        data=json.dumps(admin_data),
-        content_type="application/json"
+        json=ADMIN_DATA
     )
     assert response.status_code in (200, 201)
 
     # Second registration should fail
     response = client.post(
         "/admin/register",
-        data=json.dumps(admin_data),
-        content_type="application/json"
+        json=ADMIN_DATA
     )
     assert response.status_code == 401
 
@@ -74,29 +68,9 @@ def test_admin_registration_weak_password(client):
     import os
     os.environ["BYPASS_LOCALHOST_CHECK"] = "true"
 
-    # Test no digit
-    response = client.post(
-        "/admin/register",
-        data=json.dumps({"username": "admin2", "password": "NoDigits"}),
-        content_type="application/json"
-    )
-    assert response.status_code == 400
-
-    # Test no letter
-    response = client.post(
-        "/admin/register",
-        data=json.dumps({"username": "admin3", "password": "12345678"}),
-        content_type="application/json"
-    )
-    assert response.status_code == 400
-
-    # Test too short
-    response = client.post(
-        "/admin/register",
-        data=json.dumps({"username": "admin4", "password": "Short1"}),
-        content_type="application/json"
-    )
-    assert response.status_code == 400
+    for registration in WEAK_PASSWORD_REGISTRATIONS:
+        response = client.post("/admin/register", json=registration)
+        assert response.status_code == 400, registration
 
 
 def test_login(client, test_user_app):
@@ -108,8 +82,7 @@ def test_login(client, test_user_app):
 
     response = client.post(
         "/auth/login",
-        data=json.dumps(login_data),
-        content_type="application/json"
+        json=login_data
     )
 
     assert response.status_code == 200
@@ -129,8 +102,7 @@ def test_login_wrong_password(client, test_user_app):
 
     response = client.post(
         "/auth/login",
-        data=json.dumps(login_data),
-        content_type="application/json"
+        json=login_data
     )
 
     assert response.status_code == 401
@@ -145,8 +117,7 @@ def test_login_nonexistent_user(client):
 
     response = client.post(
         "/auth/login",
-        data=json.dumps(login_data),
-        content_type="application/json"
+        json=login_data
     )
 
     assert response.status_code == 401
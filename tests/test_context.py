@@ -403,6 +403,9 @@ def test_is_primitive_type():
 
 def test_substantive_and_primitive_are_mutually_exclusive():
     """Substantive and primitive types should not overlap."""
+    overlap = set(SUBSTANTIVE_TYPES) & set(PRIMITIVE_TYPES)
+    assert not overlap, f"Types cannot be both substantive and primitive: {sorted(overlap)}"
+
     context_ops = ContextOperations(None)
 
     for entity_type in SUBSTANTIVE_TYPES:
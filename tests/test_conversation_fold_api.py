@@ -8,132 +8,82 @@ Tests fold operation through the Semantic API:
 
 import pytest
 
-
-class TestFoldAPI:
-    """Test fold verb through Semantic API."""
-
-    def test_fold_request_validation(self, client, auth_headers):
-        """Fold request validates correctly."""
-        # First create a ConversationLog
-        create_response = client.post("/mg", json={
-            "op": "create",
-            "type": "ConversationLog",
-            "data": {
-                "parent_uuid": None,
-                "items": [],
-            }
-        }, headers=auth_headers)
-        assert create_response.status_code == 200
-        log_uuid = create_response.json["result"]["uuid"]
-
-        # Now fold it
-        response = client.post("/mg", json={
-            "op": "fold",
-            "target": log_uuid,
-            "summary_content": "Summary of conversation",
-            "author": "operator",
-        }, headers=auth_headers)
-
-        assert response.status_code == 200
-        result = response.json["result"]
-        assert result["collapsed"] is True
-        assert result["summary"]["content"] == "Summary of conversation"
-        assert result["summary"]["author"] == "operator"
-        assert "timestamp" in result["summary"]
-
-    def test_fold_with_fragment_ids(self, client, auth_headers):
-        """Fold request includes fragment IDs."""
-        # Create a ConversationLog
-        create_response = client.post("/mg", json={
-            "op": "create",
-            "type": "ConversationLog",
-            "data": {"parent_uuid": None, "items": []}
-        }, headers=auth_headers)
-        log_uuid = create_response.json["result"]["uuid"]
-
-        # Fold with fragments
-        response = client.post("/mg", json={
-            "op": "fold",
-            "target": log_uuid,
+# (payload overrides, expected status, expected summary fields or None)
+FOLD_CASES = [
+    pytest.param(
+        {"summary_content": "Summary of conversation", "author": "operator"},
+        200,
+        {"content": "Summary of conversation", "author": "operator"},
+        id="operator",
+    ),
+    pytest.param(
+        {
             "summary_content": "Used fragments ^abc and ^def",
             "author": "agent",
             "fragment_ids": ["^abc", "^def"],
-        }, headers=auth_headers)
-
-        assert response.status_code == 200
-        result = response.json["result"]
-        assert result["summary"]["fragment_ids"] == ["^abc", "^def"]
-
-    def test_fold_empty_summary_returns_error(self, client, auth_headers):
-        """Fold request with empty summary returns validation error."""
-        # Create a ConversationLog
-        create_response = client.post("/mg", json={
-            "op": "create",
-            "type": "ConversationLog",
-            "data": {"parent_uuid": None, "items": []}
-        }, headers=auth_headers)
-        log_uuid = create_response.json["result"]["uuid"]
+        },
+        200,
+        {"fragment_ids": ["^abc", "^def"]},
+        id="fragment_ids",
+    ),
+    pytest.param(
+        {"summary_content": "System-generated summary", "author": "system"},
+        200,
+        {"author": "system"},
+        id="system_author",
+    ),
+    pytest.param(
+        {"summary_content": "", "author": "operator"},
+        400,
+        None,
+        id="empty_summary",
+    ),
+    pytest.param(
+        {"summary_content": "Summary", "author": "invalid_author"},
+        400,
+        None,
+        id="invalid_author",
+    ),
+    pytest.param(
+        {"target": "core_nonexistent123", "summary_content": "Summary", "author": "operator"},
+        404,
+        None,
+        id="nonexistent_log",
+    ),
+]
 
-        # Try to fold with empty summary
-        response = client.post("/mg", json={
-            "op": "fold",
-            "target": log_uuid,
-            "summary_content": "",
-            "author": "operator",
-        }, headers=auth_headers)
 
-        assert response.status_code == 400
-        # Check for validation error
-        assert response.json["ok"] is False
+class TestFoldAPI:
+    """Test fold verb through Semantic API."""
 
-    def test_fold_invalid_author_returns_error(self, client, auth_headers):
-        """Fold request with invalid author returns validation error."""
-        # Create a ConversationLog
+    @pytest.fixture
+    def conversation_log_uuid(self, client, auth_headers):
+        """Create an empty ConversationLog and return its core_ UUID."""
         create_response = client.post("/mg", json={
             "op": "create",
             "type": "ConversationLog",
             "data": {"parent_uuid": None, "items": []}
         }, headers=auth_headers)
-        log_uuid = create_response.json["result"]["uuid"]
-
-        # Try to fold with invalid author
-        response = client.post("/mg", json={
-            "op": "fold",
-            "target": log_uuid,
-            "summary_content": "Summary",
-            "author": "invalid_author",
-        }, headers=auth_headers)
-
-        assert response.status_code == 400
+        assert create_response.status_code == 200
+        return create_response.json["result"]["uuid"]
 
-    def test_fold_nonexistent_log_returns_error(self, client, auth_headers):
-        """Fold request on non-existent log returns 404."""
+    @pytest.mark.parametrize("payload,status,summary_checks", FOLD_CASES)
+    def test_fold(self, client, auth_headers, conversation_log_uuid, payload, status, summary_checks):
+        """Fold a fresh ConversationLog and check status and summary fields."""
         response = client.post("/mg", json={
             "op": "fold",
-            "target": "core_nonexistent123",
-            "summary_content": "Summary",
-            "author": "operator",
-        }, headers=auth_headers)
-
-        assert response.status_code == 404
-
-    def test_fold_by_system_author(self, client, auth_headers):
-        """Fold request with system author."""
-        # Create a ConversationLog
-        create_response = client.post("/mg", json={
-            "op": "create",
-            "type": "ConversationLog",
-            "data": {"parent_uuid": None, "items": []}
+            "target": conversation_log_uuid,
+            **payload,
         }, headers=auth_headers)
-        log_uuid = create_response.json["result"]["uuid"]
 
-        # Fold by system
-        response = client.post("/mg", json={
-            "op": "fold",
-            "target": log_uuid,
-            "summary_content": "System-generated summary",
-            "author": "system",
-        }, headers=auth_headers)
+        body = response.json
+        assert response.status_code == status
+        if status != 200:
+            assert body["ok"] is False
+            return
 
-        assert response.status_code == 200
-        assert response.json["result"]["summary"]["author"] == "system"
+        result = body["result"]
+        assert result["collapsed"] is True
+        assert "timestamp" in result["summary"]
+        for field, expected in summary_checks.items():
+            assert result["summary"][field] == expected
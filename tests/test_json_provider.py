@@ -0,0 +1,83 @@
+"""Tests for the orjson-backed Flask JSON provider.
+
+The provider must be a drop-in replacement for Flask's DefaultJSONProvider:
+same key order, same handling of non-JSON-native types.
+"""
+
+import datetime
+import decimal
+import uuid
+
+from flask.json.provider import DefaultJSONProvider
+
+from api.json_provider import OrjsonProvider
+
+
+def test_app_uses_orjson_provider(flask_app):
+    """create_app() should install the orjson provider."""
+    assert isinstance(flask_app.json, OrjsonProvider)
+
+
+def test_dumps_matches_default_provider(flask_app):
+    """Decoded output should match the stdlib provider for mixed types."""
+    obj = {
+        "b": 1,
+        "a": {2: "int key"},
+        "when": datetime.datetime(2026, 2, 8, 12, 30, 0),
+        "day": datetime.date(2026, 2, 8),
+        "amount": decimal.Decimal("42.50"),
+        "id": uuid.UUID(int=1),
+        "nested": [None, True, 1.5, "text"],
+    }
+    default = DefaultJSONProvider(flask_app)
+
+    assert flask_app.json.loads(flask_app.json.dumps(obj)) == default.loads(default.dumps(obj))
+
+
+def test_dumps_sorts_keys(flask_app):
+    """Keys should be sorted like DefaultJSONProvider (sort_keys=True)."""
+    assert flask_app.json.dumps({"b": 1, "a": 2}) == '{"a":2,"b":1}'
+
+
+def test_loads_accepts_bytes(flask_app):
+    """loads() should accept raw request bytes as well as str."""
+    assert flask_app.json.loads(b'{"op": "get"}') == {"op": "get"}
+
+
+def test_dumps_falls_back_for_ints_beyond_64_bits(flask_app):
+    """Integers orjson cannot encode should serialize via the stdlib, not raise."""
+    big = 123456789012345678901234567890
+    dumped = flask_app.json.dumps({"b": big, "a": -big})
+
+    assert dumped == f'{{"a":{-big},"b":{big}}}'
+
+
+def test_loads_keeps_ints_beyond_64_bits_exact(flask_app):
+    """Integers orjson would decode as floats should stay exact ints."""
+    big = 123456789012345678901234567890
+    for body in (f'{{"amount": {big}}}', f'{{"amount": {big}}}'.encode()):
+        decoded = flask_app.json.loads(body)
+        assert decoded == {"amount": big}
+        assert isinstance(decoded["amount"], int)
+
+
+def test_big_int_round_trips_through_request_and_response(flask_app):
+    """A request body with a huge int should echo back unchanged."""
+    big = 123456789012345678901234567890
+    with flask_app.test_request_context(
+        "/", method="POST", data=f'{{"n": {big}}}', content_type="application/json"
+    ):
+        from flask import jsonify, request
+
+        payload = request.get_json()
+        assert payload == {"n": big}
+        assert jsonify(payload).get_data(as_text=True).strip() == f'{{"n":{big}}}'
+
+
+def test_jsonify_response(flask_app):
+    """Responses through the app should still decode normally."""
+    with flask_app.test_client() as client:
+        response = client.get("/health")
+
+    assert response.mimetype == "application/json"
+    assert response.get_json() == {"status": "ok"}
@@ -4,8 +4,6 @@ This test module verifies the get_db_path() function and environment
 variable support for database path resolution.
 """
 
-import os
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -21,195 +19,159 @@ class TestGetDbPath:
         with pytest.raises(ValueError, match="Invalid layer"):
             get_db_path("invalid")
 
-    def test_get_db_path_layer_specific_override_soil(self):
+    def test_get_db_path_layer_specific_override_soil(self, monkeypatch):
         """Test layer-specific override for soil (MEMOGARDEN_SOIL_DB)."""
         custom_path = "/custom/soil.db"
-        os.environ["MEMOGARDEN_SOIL_DB"] = custom_path
+        monkeypatch.setenv("MEMOGARDEN_SOIL_DB", custom_path)
 
-        try:
-            result = get_db_path("soil")
-            assert result == Path(custom_path)
-        finally:
-            del os.environ["MEMOGARDEN_SOIL_DB"]
+        result = get_db_path("soil")
+        assert result == Path(custom_path)
 
-    def test_get_db_path_layer_specific_override_core(self):
+    def test_get_db_path_layer_specific_override_core(self, monkeypatch):
         """Test layer-specific override for core (MEMOGARDEN_CORE_DB)."""
         custom_path = "/custom/core.db"
-        os.environ["MEMOGARDEN_CORE_DB"] = custom_path
+        monkeypatch.setenv("MEMOGARDEN_CORE_DB", custom_path)
 
-        try:
-            result = get_db_path("core")
-            assert result == Path(custom_path)
-        finally:
-            del os.environ["MEMOGARDEN_CORE_DB"]
+        result = get_db_path("core")
+        assert result == Path(custom_path)
 
-    def test_get_db_path_shared_data_dir_soil(self):
+    def test_get_db_path_shared_data_dir_soil(self, monkeypatch):
         """Test shared data directory for soil (MEMOGARDEN_DATA_DIR)."""
         data_dir = "/data"
-        os.environ["MEMOGARDEN_DATA_DIR"] = data_dir
+        monkeypatch.delenv("MEMOGARDEN_SOIL_DB", raising=False)
+        monkeypatch.setenv("MEMOGARDEN_DATA_DIR", data_dir)
 
-        try:
-            result = get_db_path("soil")
-            assert result == Path(f"{data_dir}/soil.db")
-        finally:
-            del os.environ["MEMOGARDEN_DATA_DIR"]
+        result = get_db_path("soil")
+        assert result == Path(f"{data_dir}/soil.db")
 
-    def test_get_db_path_shared_data_dir_core(self):
+    def test_get_db_path_shared_data_dir_core(self, monkeypatch):
         """Test shared data directory for core (MEMOGARDEN_DATA_DIR)."""
         data_dir = "/data"
-        os.environ["MEMOGARDEN_DATA_DIR"] = data_dir
+        monkeypatch.delenv("MEMOGARDEN_CORE_DB", raising=False)
+        monkeypatch.setenv("MEMOGARDEN_DATA_DIR", data_dir)
 
-        try:
-            result = get_db_path("core")
-            assert result == Path(f"{data_dir}/core.db")
-        finally:
-            del os.environ["MEMOGARDEN_DATA_DIR"]
+        result = get_db_path("core")
+        assert result == Path(f"{data_dir}/core.db")
 
-    def test_get_db_path_layer_specific_takes_precedence(self):
+    def test_get_db_path_layer_specific_takes_precedence(self, monkeypatch):
         """Test that layer-specific override takes precedence over data dir."""
         layer_path = "/layer/soil.db"
         data_dir = "/data"
 
-        os.environ["MEMOGARDEN_SOIL_DB"] = layer_path
-        os.environ["MEMOGARDEN_DATA_DIR"] = data_dir
+        monkeypatch.setenv("MEMOGARDEN_SOIL_DB", layer_path)
+        monkeypatch.setenv("MEMOGARDEN_DATA_DIR", data_dir)
 
-        try:
-            result = get_db_path("soil")
-            # Layer-specific should win
-            assert result == Path(layer_path)
-            assert result != Path(f"{data_dir}/soil.db")
-        finally:
-            del os.environ["MEMOGARDEN_SOIL_DB"]
-            del os.environ["MEMOGARDEN_DATA_DIR"]
+        result = get_db_path("soil")
+        # Layer-specific should win
+        assert result == Path(layer_path)
+        assert result != Path(f"{data_dir}/soil.db")
 
-    def test_get_db_path_default_current_dir_soil(self):
+    def test_get_db_path_default_current_dir_soil(self, monkeypatch):
         """Test default path (current directory) for soil."""
         # Ensure no env vars are set
-        for key in ["MEMOGARDEN_SOIL_DB", "MEMOGARDEN_DATA_DIR"]:
-            os.environ.pop(key, None)
+        monkeypatch.delenv("MEMOGARDEN_SOIL_DB", raising=False)
+        monkeypatch.delenv("MEMOGARDEN_DATA_DIR", raising=False)
 
         result = get_db_path("soil")
         assert result == Path("./soil.db")
 
-    def test_get_db_path_default_current_dir_core(self):
+    def test_get_db_path_default_current_dir_core(self, monkeypatch):
         """Test default path (current directory) for core."""
         # Ensure no env vars are set
-        for key in ["MEMOGARDEN_CORE_DB", "MEMOGARDEN_DATA_DIR"]:
-            os.environ.pop(key, None)
+        monkeypatch.delenv("MEMOGARDEN_CORE_DB", raising=False)
+        monkeypatch.delenv("MEMOGARDEN_DATA_DIR", raising=False)
 
         result = get_db_path("core")
         assert result == Path("./core.db")
 
 
-class TestCorePathResolution:
-    """Tests for Core database path resolution integration."""
+PATH_SOURCES = ["explicit", "env", "data_dir"]
 
-    def test_core_uses_explicit_path(self, tmp_path):
-        """Test that Core uses explicit path when provided."""
-        from utils.config import Settings
-        from system.core import _create_connection
 
-        db_path = tmp_path / "test_core.db"
-        settings = Settings(database_path=str(db_path))
+def _configure_path_source(source, layer, base, monkeypatch):
+    """Set up one RFC-004 path source for a database layer.
 
-        # Temporarily replace default_settings
-        import system.core
-        original_settings = system.core.settings
-        system.core.settings = settings
-
-        try:
-            conn = _create_connection()
-            assert db_path.exists()
-            conn.close()
-        finally:
-            system.core.settings = original_settings
-
-    def test_core_uses_env_var_path(self, tmp_path, monkeypatch):
-        """Test that Core uses environment variable path when database_path is None."""
-        from utils.config import Settings
-        from system.core import _create_connection
+    Clears the other sources first so only the requested one applies.
+    Only computes paths; nothing is created under base.
 
-        db_path = tmp_path / "env_core.db"
-        monkeypatch.setenv("MEMOGARDEN_CORE_DB", str(db_path))
+    Args:
+        source: "explicit", "env" (MEMOGARDEN_<LAYER>_DB) or "data_dir"
+            (MEMOGARDEN_DATA_DIR)
+        layer: "core" or "soil"
+        base: Directory the paths are built under
+        monkeypatch: pytest monkeypatch
 
-        settings = Settings(database_path=None)  # None triggers env var resolution
+    Returns:
+        Tuple of (explicit path to pass, or None; expected database path)
+    """
+    layer_var = f"MEMOGARDEN_{layer.upper()}_DB"
+    monkeypatch.delenv(layer_var, raising=False)
+    monkeypatch.delenv("MEMOGARDEN_DATA_DIR", raising=False)
 
-        # Temporarily replace default_settings
-        import system.core
-        original_settings = system.core.settings
-        system.core.settings = settings
-
-        try:
-            conn = _create_connection()
-            assert db_path.exists()
-            conn.close()
-        finally:
-            system.core.settings = original_settings
-
-    def test_core_uses_data_dir_path(self, tmp_path, monkeypatch):
-        """Test that Core uses data directory path when database_path is None."""
-        from utils.config import Settings
-        from system.core import _create_connection
+    if source == "explicit":
+        db_path = base / f"test_{layer}.db"
+        return db_path, db_path
 
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        monkeypatch.setenv("MEMOGARDEN_DATA_DIR", str(data_dir))
+    if source == "env":
+        db_path = base / f"env_{layer}.db"
+        monkeypatch.setenv(layer_var, str(db_path))
+        return None, db_path
 
-        settings = Settings(database_path=None)  # None triggers env var resolution
+    data_dir = base / "data"
+    monkeypatch.setenv("MEMOGARDEN_DATA_DIR", str(data_dir))
+    return None, data_dir / f"{layer}.db"
 
-        # Temporarily replace default_settings
-        import system.core
-        original_settings = system.core.settings
-        system.core.settings = settings
 
-        try:
-            conn = _create_connection()
-            assert (data_dir / "core.db").exists()
-            conn.close()
-        finally:
-            system.core.settings = original_settings
+@pytest.mark.xdist_group("core_disk")
+class TestCorePathResolution:
+    """Tests for Core database path resolution integration."""
 
+    @pytest.mark.parametrize("source", PATH_SOURCES)
+    def test_core_path_resolution(self, source, tmp_path, monkeypatch):
+        """Test that Core creates its database at the path from each source.
 
-class TestSoilPathResolution:
-    """Tests for Soil database path resolution integration."""
+        database_path=None in Settings triggers env var resolution.
+        """
+        import system.core
+        from utils.config import Settings
 
-    def test_soil_uses_explicit_path(self, tmp_path):
-        """Test that get_soil() uses explicit path when provided."""
-        from system.soil import get_soil
+        explicit_path, expected_path = _configure_path_source(source, "core", tmp_path, monkeypatch)
+        expected_path.parent.mkdir(exist_ok=True)
+        settings = Settings(database_path=str(explicit_path) if explicit_path else None)
 
-        db_path = tmp_path / "test_soil.db"
-        soil = get_soil(db_path, init=False)
+        # Replace default settings for this test only
+        monkeypatch.setattr(system.core, "settings", settings)
 
-        assert soil.db_path == db_path
+        conn = system.core._create_connection()
+        assert expected_path.exists()
+        conn.close()
 
-    def test_soil_uses_env_var_path(self, tmp_path, monkeypatch):
-        """Test that get_soil() uses environment variable path when db_path is None."""
-        from system.soil import get_soil
 
-        db_path = tmp_path / "env_soil.db"
-        monkeypatch.setenv("MEMOGARDEN_SOIL_DB", str(db_path))
+class TestSoilPathResolution:
+    """Tests for Soil database path resolution integration."""
 
-        soil = get_soil(None, init=False)
-        assert soil.db_path == db_path
+    @pytest.mark.parametrize("source", PATH_SOURCES)
+    def test_soil_path_resolution(self, source, monkeypatch):
+        """Test that get_soil() resolves its path from each source (db_path=None uses env vars).
 
-    def test_soil_uses_data_dir_path(self, tmp_path, monkeypatch):
-        """Test that get_soil() uses data directory path when db_path is None."""
+        init=False never opens the database, so the paths need not exist.
+        """
         from system.soil import get_soil
 
-        data_dir = tmp_path / "data"
-        data_dir.mkdir()
-        monkeypatch.setenv("MEMOGARDEN_DATA_DIR", str(data_dir))
+        explicit_path, expected_path = _configure_path_source(
+            source, "soil", Path("/nonexistent"), monkeypatch
+        )
 
-        soil = get_soil(None, init=False)
-        assert soil.db_path == (data_dir / "soil.db")
+        soil = get_soil(explicit_path, init=False)
+        assert soil.db_path == expected_path
 
-    def test_soil_backward_compatible_default(self):
+    def test_soil_backward_compatible_default(self, monkeypatch):
         """Test that get_soil() without arguments uses default path (backward compatible)."""
         from system.soil import get_soil
 
         # Ensure no env vars are set
-        for key in ["MEMOGARDEN_SOIL_DB", "MEMOGARDEN_DATA_DIR"]:
-            os.environ.pop(key, None)
+        monkeypatch.delenv("MEMOGARDEN_SOIL_DB", raising=False)
+        monkeypatch.delenv("MEMOGARDEN_DATA_DIR", raising=False)
 
         soil = get_soil(init=False)
         assert soil.db_path == Path("./soil.db")
@@ -9,7 +9,53 @@ Tests cover:
 - DELETE /api/v1/recurrences/{id}   - Delete recurrence
 """
 
-import json
+import pytest
+
+from api.schemas.recurrence import RecurrenceCreate
+
+
+@pytest.fixture
+def bulk_recurrences(flask_app, sample_recurrence_data):
+    """
+    Seed recurrences directly through Core in a single transaction.
+
+    For tests that need existing rows rather than exercising POST; one
+    get_core() block replaces N HTTP round trips and N commits.
+
+    Returns:
+        Callable taking a count and returning the created recurrence IDs
+    """
+    from system.core import get_core
+
+    def _create(n: int) -> list[str]:
+        ids = []
+        with get_core() as core:
+            for i in range(n):
+                data = RecurrenceCreate(**{
+                    **sample_recurrence_data,
+                    "valid_from": f"2025-{i+1:02d}-01T00:00:00Z"
+                })
+                ids.append(core.recurrence.create(
+                    rrule=data.rrule,
+                    entities=data.entities,
+                    valid_from=data.valid_from,
+                    valid_until=data.valid_until,
+                ))
+        return ids
+
+    return _create
+
+
+@pytest.fixture
+def recurrence_id(client, auth_headers, sample_recurrence_data):
+    """Create a recurrence via the API and return its ID."""
+    create_response = client.post(
+        "/api/v1/recurrences",
+        headers=auth_headers,
+        json=sample_recurrence_data
+    )
+    assert create_response.status_code == 201
+    return create_response.get_json()["id"]
 
 
 def test_create_recurrence(client, auth_headers, sample_recurrence_data):
@@ -17,7 +63,7 @@ def test_create_recurrence(client, auth_headers, sample_recurrence_data):
     response = client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
+        json=sample_recurrence_data
     )
 
     assert response.status_code == 201
@@ -37,7 +83,7 @@ def test_create_recurrence_unauthenticated(client, sample_recurrence_data):
     """Test that creating a recurrence without authentication fails."""
     response = client.post(
         "/api/v1/recurrences",
-        data=json.dumps(sample_recurrence_data)
+        json=sample_recurrence_data
     )
 
     assert response.status_code == 401
@@ -56,7 +102,7 @@ def test_create_recurrence_invalid_rrule(client, auth_headers, sample_recurrence
     response = client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps(invalid_data)
+        json=invalid_data
     )
 
     assert response.status_code == 400
@@ -75,7 +121,7 @@ def test_create_recurrence_invalid_window(client, auth_headers, sample_recurrenc
     response = client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps(invalid_data)
+        json=invalid_data
     )
 
     assert response.status_code == 400
@@ -83,17 +129,8 @@ def test_create_recurrence_invalid_window(client, auth_headers, sample_recurrenc
     assert "error" in data
 
 
-def test_get_recurrence(client, auth_headers, sample_recurrence_data):
+def test_get_recurrence(client, auth_headers, recurrence_id, sample_recurrence_data):
     """Test getting a single recurrence by ID."""
-    # First create a recurrence
-    create_response = client.post(
-        "/api/v1/recurrences",
-        headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
-    )
-    recurrence = create_response.get_json()
-    recurrence_id = recurrence["id"]
-
     # Get the recurrence
     response = client.get(
         f"/api/v1/recurrences/{recurrence_id}",
@@ -122,16 +159,16 @@ def test_list_recurrences(client, auth_headers, sample_recurrence_data):
     client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
+        json=sample_recurrence_data
     )
     client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps({
+        json={
             **sample_recurrence_data,
             "rrule": "FREQ=WEEKLY;BYDAY=MO",
             "valid_from": "2025-02-01T00:00:00Z"
-        })
+        }
     )
 
     response = client.get(
@@ -151,16 +188,16 @@ def test_list_recurrences_with_filters(client, auth_headers, sample_recurrence_d
     client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
+        json=sample_recurrence_data
     )
     client.post(
         "/api/v1/recurrences",
         headers=auth_headers,
-        data=json.dumps({
+        json={
             **sample_recurrence_data,
             "rrule": "FREQ=WEEKLY;BYDAY=MO",
             "valid_from": "2025-06-01T00:00:00Z"
-        })
+        }
     )
 
     # Filter by valid_from
@@ -174,18 +211,10 @@ def test_list_recurrences_with_filters(client, auth_headers, sample_recurrence_d
     assert len(data) >= 1
 
 
-def test_list_recurrences_pagination(client, auth_headers, sample_recurrence_data):
+def test_list_recurrences_pagination(client, auth_headers, bulk_recurrences):
     """Test listing recurrences with pagination."""
     # Create multiple recurrences
-    for i in range(5):
-        client.post(
-            "/api/v1/recurrences",
-            headers=auth_headers,
-            data=json.dumps({
-                **sample_recurrence_data,
-                "valid_from": f"2025-{i+1:02d}-01T00:00:00Z"
-            })
-        )
+    bulk_recurrences(5)
 
     # Test limit
     response = client.get(
@@ -204,17 +233,8 @@ def test_list_recurrences_pagination(client, auth_headers, sample_recurrence_dat
     assert len(data) == 2
 
 
-def test_update_recurrence(client, auth_headers, sample_recurrence_data):
+def test_update_recurrence(client, auth_headers, recurrence_id):
     """Test updating a recurrence."""
-    # Create a recurrence
-    create_response = client.post(
-        "/api/v1/recurrences",
-        headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
-    )
-    recurrence = create_response.get_json()
-    recurrence_id = recurrence["id"]
-
     # Update the recurrence
     update_data = {
         "rrule": "FREQ=WEEKLY;BYDAY=MO,WE,FR",
@@ -222,7 +242,7 @@ def test_update_recurrence(client, auth_headers, sample_recurrence_data):
     response = client.put(
         f"/api/v1/recurrences/{recurrence_id}",
         headers=auth_headers,
-        data=json.dumps(update_data)
+        json=update_data
     )
 
     assert response.status_code == 200
@@ -230,17 +250,8 @@ def test_update_recurrence(client, auth_headers, sample_recurrence_data):
     assert data["rrule"] == "FREQ=WEEKLY;BYDAY=MO,WE,FR"
 
 
-def test_update_recurrence_invalid_rrule(client, auth_headers, sample_recurrence_data):
+def test_update_recurrence_invalid_rrule(client, auth_headers, recurrence_id):
     """Test that updating with invalid RRULE is rejected."""
-    # Create a recurrence
-    create_response = client.post(
-        "/api/v1/recurrences",
-        headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
-    )
-    recurrence = create_response.get_json()
-    recurrence_id = recurrence["id"]
-
     # Try to update with invalid RRULE
     update_data = {
         "rrule": "INVALID_RRULE",
@@ -248,23 +259,14 @@ def test_update_recurrence_invalid_rrule(client, auth_headers, sample_recurrence
     response = client.put(
         f"/api/v1/recurrences/{recurrence_id}",
         headers=auth_headers,
-        data=json.dumps(update_data)
+        json=update_data
     )
 
     assert response.status_code == 400
 
 
-def test_update_recurrence_invalid_window(client, auth_headers, sample_recurrence_data):
+def test_update_recurrence_invalid_window(client, auth_headers, recurrence_id):
     """Test that updating with invalid window is rejected."""
-    # Create a recurrence
-    create_response = client.post(
-        "/api/v1/recurrences",
-        headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
-    )
-    recurrence = create_response.get_json()
-    recurrence_id = recurrence["id"]
-
     # Try to update with invalid window
     update_data = {
         "valid_until": "2024-01-01T00:00:00Z",  # Before valid_from
@@ -272,23 +274,14 @@ def test_update_recurrence_invalid_window(client, auth_headers, sample_recurrenc
     response = client.put(
         f"/api/v1/recurrences/{recurrence_id}",
         headers=auth_headers,
-        data=json.dumps(update_data)
+        json=update_data
     )
 
     assert response.status_code == 400
 
 
-def test_delete_recurrence(client, auth_headers, sample_recurrence_data):
+def test_delete_recurrence(client, auth_headers, recurrence_id):
     """Test deleting a recurrence (soft delete)."""
-    # Create a recurrence
-    create_response = client.post(
-        "/api/v1/recurrences",
-        headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
-    )
-    recurrence = create_response.get_json()
-    recurrence_id = recurrence["id"]
-
     # Delete the recurrence
     response = client.delete(
         f"/api/v1/recurrences/{recurrence_id}",
@@ -299,11 +292,10 @@ def test_delete_recurrence(client, auth_headers, sample_recurrence_data):
 
     # Verify recurrence is superseded (not included in default list)
     list_response = client.get(
-        "/api/v1/recurrences",
+        f"/api/v1/recurrences?id={recurrence_id}",
         headers=auth_headers
     )
-    recurrences = list_response.get_json()
-    assert not any(r["id"] == recurrence_id for r in recurrences)
+    assert list_response.get_json() == []
 
 
 def test_delete_recurrence_not_found(client, auth_headers):
@@ -316,17 +308,9 @@ def test_delete_recurrence_not_found(client, auth_headers):
     assert response.status_code == 404
 
 
-def test_list_recurrences_include_superseded(client, auth_headers, sample_recurrence_data):
+def test_list_recurrences_include_superseded(client, auth_headers, recurrence_id):
     """Test listing recurrences with include_superseded flag."""
-    # Create and then delete a recurrence
-    create_response = client.post(
-        "/api/v1/recurrences",
-        headers=auth_headers,
-        data=json.dumps(sample_recurrence_data)
-    )
-    recurrence = create_response.get_json()
-    recurrence_id = recurrence["id"]
-
+    # Delete the recurrence
     client.delete(
         f"/api/v1/recurrences/{recurrence_id}",
         headers=auth_headers
@@ -334,19 +318,62 @@ def test_list_recurrences_include_superseded(client, auth_headers, sample_recurr
 
     # Without include_superseded - should not show
     response = client.get(
-        "/api/v1/recurrences",
+        f"/api/v1/recurrences?id={recurrence_id}",
         headers=auth_headers
     )
-    data = response.get_json()
-    assert not any(r["id"] == recurrence_id for r in data)
+    assert response.get_json() == []
 
     # With include_superseded=true - should show
     response = client.get(
-        "/api/v1/recurrences?include_superseded=true",
+        f"/api/v1/recurrences?include_superseded=true&id={recurrence_id}",
+        headers=auth_headers
+    )
+    data = response.get_json()
+    assert len(data) == 1 and data[0]["id"] == recurrence_id
+
+
+def test_list_recurrences_by_id(client, auth_headers, recurrence_id):
+    """Test that id returns just that recurrence, and nothing for unknown ids."""
+    response = client.get(
+        f"/api/v1/recurrences?id={recurrence_id}",
         headers=auth_headers
     )
+    assert response.status_code == 200
+    data = response.get_json()
+    assert len(data) == 1 and data[0]["id"] == recurrence_id
+
+    # include_superseded does not hide live recurrences
+    response = client.get(
+        f"/api/v1/recurrences?include_superseded=true&id={recurrence_id}",
+        headers=auth_headers
+    )
+    assert [r["id"] for r in response.get_json()] == [recurrence_id]
+
+    response = client.get(
+        "/api/v1/recurrences?id=550e8400-e29b-41d4-a716-446655440000",
+        headers=auth_headers
+    )
+    assert response.status_code == 200
+    assert response.get_json() == []
+
+
+@pytest.mark.parametrize("extra", [
+    "valid_from=2030-01-01T00:00:00Z",
+    "valid_until=2020-01-01T00:00:00Z",
+    "limit=1",
+    "offset=1",
+])
+def test_list_recurrences_by_id_rejects_list_filters(client, auth_headers, recurrence_id, extra):
+    """Test that id combined with window filters or paging is rejected."""
+    response = client.get(
+        f"/api/v1/recurrences?id={recurrence_id}&{extra}",
+        headers=auth_headers
+    )
+
+    assert response.status_code == 400
     data = response.get_json()
-    assert any(r["id"] == recurrence_id for r in data)
+    assert data["error"]["type"] == "ValidationError"
+    assert data["error"]["details"]["conflicting_params"] == [extra.split("=")[0]]
 
 
 def test_authentication_with_api_key(client, auth_headers_apikey, sample_recurrence_data):
@@ -354,7 +381,7 @@ def test_authentication_with_api_key(client, auth_headers_apikey, sample_recurre
     response = client.post(
         "/api/v1/recurrences",
         headers=auth_headers_apikey,
-        data=json.dumps(sample_recurrence_data)
+        json=sample_recurrence_data
     )
 
     assert response.status_code == 201
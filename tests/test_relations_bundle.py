@@ -12,88 +12,102 @@ import pytest
 from system.core import get_core
 from utils import uid
 
-
-class TestUnlinkVerb:
-    """Test unlink verb - remove user relation."""
-
-    def test_unlink_removes_relation(self, client, auth_headers):
-        """Test that unlink removes a user relation."""
-        # First create a relation
-        create_response = client.post(
+# Fixed endpoint UUIDs; relations don't require the entities to exist
+ENTITY_1 = "core_00000000-0000-0000-0000-000000000001"
+ENTITY_2 = "core_00000000-0000-0000-0000-000000000002"
+ENTITY_3 = "core_00000000-0000-0000-0000-000000000003"
+ENTITY_4 = "core_00000000-0000-0000-0000-000000000004"
+MISSING_RELATION = "core_00000000-0000-0000-0000-999999999999"
+
+
+# (op, extra payload fields, expected result fields, fields that must be set)
+LIVE_RELATION_CASES = [
+    pytest.param(
+        "get_relation",
+        {},
+        {"kind": "explicit_link", "source_type": "entity", "target_type": "entity"},
+        ("time_horizon",),
+        id="get_relation",
+    ),
+    pytest.param(
+        "edit_relation",
+        {"set": {"metadata": {"key": "value", "number": 42}}},
+        {"metadata": {"key": "value", "number": 42}},
+        (),
+        id="edit_relation_metadata",
+    ),
+    pytest.param(
+        "unlink",
+        {},
+        {"deleted": True},
+        (),
+        id="unlink",
+    ),
+]
+
+# Verbs that take a relation UUID as target, with otherwise valid payloads
+MISSING_RELATION_CASES = [
+    pytest.param("get_relation", {}, id="get_relation"),
+    pytest.param("edit_relation", {"set": {"time_horizon": 100}}, id="edit_relation"),
+    pytest.param("unlink", {}, id="unlink"),
+]
+
+
+@pytest.fixture
+def live_relation(make_relation):
+    """Create an explicit_link relation and return its core_ UUID."""
+    return make_relation(ENTITY_1, ENTITY_2)
+
+
+class TestRelationTargetVerbs:
+    """Test get_relation, edit_relation and unlink against a single relation."""
+
+    @pytest.mark.parametrize("op,extra,expected,required", LIVE_RELATION_CASES)
+    def test_verb_on_live_relation(self, client, auth_headers, live_relation, op, extra, expected, required):
+        """Test each verb succeeds on an existing relation and reports it."""
+        response = client.post(
             "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-            },
+            json={"op": op, "target": live_relation, **extra},
             headers=auth_headers
         )
-        assert create_response.status_code == 200
-        relation_uuid = create_response.get_json()["result"]["uuid"]
+        body = response.get_json()
+        assert response.status_code == 200, body
+        result = body["result"]
+        assert result["uuid"] == live_relation
+        for field, value in expected.items():
+            assert result[field] == value
+        for field in required:
+            assert result[field] is not None
 
-        # Now unlink it
-        unlink_response = client.post(
+    @pytest.mark.parametrize("op,extra", MISSING_RELATION_CASES)
+    def test_verb_on_missing_relation_returns_404(self, client, auth_headers, op, extra):
+        """Test each verb returns 404 for a nonexistent relation."""
+        response = client.post(
             "/mg",
-            json={
-                "op": "unlink",
-                "target": relation_uuid,
-            },
+            json={"op": op, "target": MISSING_RELATION, **extra},
             headers=auth_headers
         )
+        assert response.status_code == 404
 
-        # Debug: print error if not successful
-        if unlink_response.status_code != 200:
-            print(f"ERROR: Status {unlink_response.status_code}")
-            print(f"Response: {unlink_response.get_json()}")
-
-        assert unlink_response.status_code == 200
-        result = unlink_response.get_json()["result"]
-        assert result["deleted"] is True
-        assert result["uuid"] == relation_uuid
-
-        # Verify relation is deleted
-        with get_core() as core:
-            from system.exceptions import ResourceNotFound
-            with pytest.raises(ResourceNotFound):
-                core.relation.get_by_id(relation_uuid)
-
-    def test_unlink_nonexistent_relation(self, client, auth_headers):
-        """Test that unlinking a nonexistent relation returns 404."""
-        fake_uuid = "core_00000000-0000-0000-0000-999999999999"
+    def test_unlink_removes_relation(self, client, auth_headers, live_relation):
+        """Test that unlink deletes the relation from Core."""
         response = client.post(
             "/mg",
-            json={
-                "op": "unlink",
-                "target": fake_uuid,
-            },
+            json={"op": "unlink", "target": live_relation},
             headers=auth_headers
         )
-        assert response.status_code == 404
-
+        assert response.status_code == 200
 
-class TestEditRelationVerb:
-    """Test edit_relation verb - edit relation attributes."""
+        # Verify relation is deleted
+        with get_core() as core:
+            from system.exceptions import ResourceNotFound
+            with pytest.raises(ResourceNotFound):
+                core.relation.get_by_id(live_relation)
 
-    def test_edit_relation_time_horizon(self, client, auth_headers):
+    def test_edit_relation_time_horizon(self, client, auth_headers, live_relation):
         """Test that edit_relation can update time_horizon."""
-        # First create a relation
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-                "initial_horizon_days": 7,
-            },
-            headers=auth_headers
-        )
-        assert create_response.status_code == 200
-        relation_uuid = create_response.get_json()["result"]["uuid"]
-        original_horizon = create_response.get_json()["result"]["time_horizon"]
+        with get_core() as core:
+            original_horizon = core.relation.get_by_id(live_relation)["time_horizon"]
 
         # Edit the time horizon
         from utils.time import current_day
@@ -103,7 +117,7 @@ class TestEditRelationVerb:
             "/mg",
             json={
                 "op": "edit_relation",
-                "target": relation_uuid,
+                "target": live_relation,
                 "set": {
                     "time_horizon": new_horizon,
                 }
@@ -115,140 +129,15 @@ class TestEditRelationVerb:
         assert result["time_horizon"] == new_horizon
         assert result["time_horizon"] != original_horizon
 
-    def test_edit_relation_metadata(self, client, auth_headers):
-        """Test that edit_relation can update metadata."""
-        # First create a relation
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
-        assert create_response.status_code == 200
-        relation_uuid = create_response.get_json()["result"]["uuid"]
-
-        # Edit the metadata
-        new_metadata = {"key": "value", "number": 42}
-        edit_response = client.post(
-            "/mg",
-            json={
-                "op": "edit_relation",
-                "target": relation_uuid,
-                "set": {
-                    "metadata": new_metadata,
-                }
-            },
-            headers=auth_headers
-        )
-        assert edit_response.status_code == 200
-        result = edit_response.get_json()["result"]
-        assert result["metadata"] == new_metadata
-
-    def test_edit_relation_nonexistent(self, client, auth_headers):
-        """Test that editing a nonexistent relation returns 404."""
-        fake_uuid = "core_00000000-0000-0000-0000-999999999999"
-        response = client.post(
-            "/mg",
-            json={
-                "op": "edit_relation",
-                "target": fake_uuid,
-                "set": {
-                    "time_horizon": 100,
-                }
-            },
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-
-
-class TestGetRelationVerb:
-    """Test get_relation verb - get relation by UUID."""
-
-    def test_get_relation_by_uuid(self, client, auth_headers):
-        """Test that get_relation returns relation details."""
-        # First create a relation
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-                "initial_horizon_days": 14,
-            },
-            headers=auth_headers
-        )
-        assert create_response.status_code == 200
-        relation_uuid = create_response.get_json()["result"]["uuid"]
-
-        # Get the relation
-        get_response = client.post(
-            "/mg",
-            json={
-                "op": "get_relation",
-                "target": relation_uuid,
-            },
-            headers=auth_headers
-        )
-        assert get_response.status_code == 200
-        result = get_response.get_json()["result"]
-        assert result["uuid"] == relation_uuid
-        assert result["kind"] == "explicit_link"
-        assert result["source_type"] == "entity"
-        assert result["target_type"] == "entity"
-        assert result["time_horizon"] is not None
-
-    def test_get_relation_nonexistent(self, client, auth_headers):
-        """Test that getting a nonexistent relation returns 404."""
-        fake_uuid = "core_00000000-0000-0000-0000-999999999999"
-        response = client.post(
-            "/mg",
-            json={
-                "op": "get_relation",
-                "target": fake_uuid,
-            },
-            headers=auth_headers
-        )
-        assert response.status_code == 404
-
 
 class TestQueryRelationVerb:
     """Test query_relation verb - query relations with filters."""
 
-    def test_query_relation_by_source(self, client, auth_headers):
+    def test_query_relation_by_source(self, client, auth_headers, bulk_link):
         """Test that query_relation can filter by source."""
         # Create some test relations
-        source = "core_00000000-0000-0000-0000-000000000001"
-
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": source,
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
-
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000003",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000004",
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        source = ENTITY_1
+        bulk_link([(source, ENTITY_2), (ENTITY_3, ENTITY_4)])
 
         # Query by source
         response = client.post(
@@ -266,22 +155,11 @@ class TestQueryRelationVerb:
         for rel in result["results"]:
             assert rel["source"] == source
 
-    def test_query_relation_by_target(self, client, auth_headers):
+    def test_query_relation_by_target(self, client, auth_headers, make_relation):
         """Test that query_relation can filter by target."""
         # Create some test relations
-        target = "core_00000000-0000-0000-0000-000000000002"
-
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": target,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        target = ENTITY_2
+        make_relation(ENTITY_1, target)
 
         # Query by target
         response = client.post(
@@ -299,20 +177,10 @@ class TestQueryRelationVerb:
         for rel in result["results"]:
             assert rel["target"] == target
 
-    def test_query_relation_by_kind(self, client, auth_headers):
+    def test_query_relation_by_kind(self, client, auth_headers, make_relation):
         """Test that query_relation can filter by kind."""
         # Create a relation
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        make_relation(ENTITY_1, ENTITY_2)
 
         # Query by kind
         response = client.post(
@@ -330,22 +198,10 @@ class TestQueryRelationVerb:
         for rel in result["results"]:
             assert rel["kind"] == "explicit_link"
 
-    def test_query_relation_alive_only(self, client, auth_headers):
+    def test_query_relation_alive_only(self, client, auth_headers, make_relation):
         """Test that query_relation can filter by alive status."""
-        # Create a relation with short horizon
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": "core_00000000-0000-0000-0000-000000000001",
-                "source_type": "entity",
-                "target": "core_00000000-0000-0000-0000-000000000002",
-                "target_type": "entity",
-                "initial_horizon_days": 1,  # Expires tomorrow
-            },
-            headers=auth_headers
-        )
-        assert create_response.status_code == 200
+        # Create a relation with short horizon (expires tomorrow)
+        make_relation(ENTITY_1, ENTITY_2, initial_horizon_days=1)
 
         # Query alive relations (should include the new one)
         response_alive = client.post(
@@ -360,21 +216,14 @@ class TestQueryRelationVerb:
         result_alive = response_alive.get_json()["result"]
         assert result_alive["count"] >= 1
 
-    def test_query_relation_limit(self, client, auth_headers):
+    def test_query_relation_limit(self, client, auth_headers, bulk_link):
         """Test that query_relation respects limit parameter."""
         # Create multiple relations
-        for i in range(5):
-            client.post(
-                "/mg",
-                json={
-                    "op": "link",
-                    "source": f"core_00000000-0000-0000-0000-000000000010{i}",
-                    "source_type": "entity",
-                    "target": f"core_00000000-0000-0000-0000-000000000020{i}",
-                    "target_type": "entity",
-                },
-                headers=auth_headers
-            )
+        bulk_link([
+            (f"core_00000000-0000-0000-0000-000000000010{i}",
+             f"core_00000000-0000-0000-0000-000000000020{i}")
+            for i in range(5)
+        ])
 
         # Query with limit
         response = client.post(
@@ -393,54 +242,12 @@ class TestQueryRelationVerb:
 class TestExploreVerb:
     """Test explore verb - graph expansion from anchor."""
 
-    def test_explore_outgoing(self, client, auth_headers):
+    def test_explore_outgoing(self, client, auth_headers, artifact_pool, bulk_link):
         """Test that explore can traverse outgoing relations."""
-        # First create actual entities to link
-        create_a = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "A"}},
-            headers=auth_headers
-        )
-        uuid_a = create_a.get_json()["result"]["uuid"]
-
-        create_b = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "B"}},
-            headers=auth_headers
-        )
-        uuid_b = create_b.get_json()["result"]["uuid"]
-
-        create_c = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "C"}},
-            headers=auth_headers
-        )
-        uuid_c = create_c.get_json()["result"]["uuid"]
+        uuid_a, uuid_b, uuid_c = artifact_pool[:3]
 
         # Create a chain: A -> B -> C
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": uuid_a,
-                "source_type": "entity",
-                "target": uuid_b,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
-
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": uuid_b,
-                "source_type": "entity",
-                "target": uuid_c,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        bulk_link([(uuid_a, uuid_b), (uuid_b, uuid_c)])
 
         # Explore from A (outgoing)
         response = client.post(
@@ -461,54 +268,12 @@ class TestExploreVerb:
         for edge in result["edges"]:
             assert edge["direction"] == "outgoing"
 
-    def test_explore_incoming(self, client, auth_headers):
+    def test_explore_incoming(self, client, auth_headers, artifact_pool, bulk_link):
         """Test that explore can traverse incoming relations."""
-        # First create actual entities to link
-        create_a = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "A"}},
-            headers=auth_headers
-        )
-        uuid_a = create_a.get_json()["result"]["uuid"]
-
-        create_b = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "B"}},
-            headers=auth_headers
-        )
-        uuid_b = create_b.get_json()["result"]["uuid"]
-
-        create_c = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "C"}},
-            headers=auth_headers
-        )
-        uuid_c = create_c.get_json()["result"]["uuid"]
+        uuid_a, uuid_b, uuid_c = artifact_pool[:3]
 
         # Create a chain: A <- B <- C
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": uuid_b,
-                "source_type": "entity",
-                "target": uuid_a,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
-
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": uuid_c,
-                "source_type": "entity",
-                "target": uuid_b,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        bulk_link([(uuid_b, uuid_a), (uuid_c, uuid_b)])
 
         # Explore from A (incoming)
         response = client.post(
@@ -529,35 +294,10 @@ class TestExploreVerb:
         for edge in result["edges"]:
             assert edge["direction"] == "incoming"
 
-    def test_explore_both_directions(self, client, auth_headers):
+    def test_explore_both_directions(self, client, auth_headers, artifact_pool, bulk_link):
         """Test that explore can traverse both directions."""
-        # Create entities and relation
-        create_a = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "A"}},
-            headers=auth_headers
-        )
-        uuid_a = create_a.get_json()["result"]["uuid"]
-
-        create_b = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "B"}},
-            headers=auth_headers
-        )
-        uuid_b = create_b.get_json()["result"]["uuid"]
-
-        # Create relation
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": uuid_a,
-                "source_type": "entity",
-                "target": uuid_b,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        uuid_a, uuid_b = artifact_pool[:2]
+        bulk_link([(uuid_a, uuid_b)])
 
         # Explore both directions
         response = client.post(
@@ -575,31 +315,12 @@ class TestExploreVerb:
         assert "nodes" in result
         assert "edges" in result
 
-    def test_explore_radius_limit(self, client, auth_headers):
+    def test_explore_radius_limit(self, client, auth_headers, artifact_pool, bulk_link):
         """Test that explore respects radius limit."""
-        # Create a chain of entities
-        uuids = []
-        for i in range(4):
-            response = client.post(
-                "/mg",
-                json={"op": "create", "type": "Artifact", "data": {"name": f"Node{i}"}},
-                headers=auth_headers
-            )
-            uuids.append(response.get_json()["result"]["uuid"])
+        uuids = artifact_pool[:4]
 
         # Create chain: A -> B -> C -> D
-        for i in range(3):
-            client.post(
-                "/mg",
-                json={
-                    "op": "link",
-                    "source": uuids[i],
-                    "source_type": "entity",
-                    "target": uuids[i + 1],
-                    "target_type": "entity",
-                },
-                headers=auth_headers
-            )
+        bulk_link([(uuids[i], uuids[i + 1]) for i in range(3)])
 
         # Explore with radius 1
         response = client.post(
@@ -617,35 +338,10 @@ class TestExploreVerb:
         # Should only traverse 1 hop
         # (actual count depends on implementation details)
 
-    def test_explore_kind_filter(self, client, auth_headers):
+    def test_explore_kind_filter(self, client, auth_headers, artifact_pool, bulk_link):
         """Test that explore can filter by relation kind."""
-        # Create entities and relation
-        create_a = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "A"}},
-            headers=auth_headers
-        )
-        uuid_a = create_a.get_json()["result"]["uuid"]
-
-        create_b = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "B"}},
-            headers=auth_headers
-        )
-        uuid_b = create_b.get_json()["result"]["uuid"]
-
-        # Create relation
-        client.post(
-            "/mg",
-            json={
-                "op": "link",
-                "source": uuid_a,
-                "source_type": "entity",
-                "target": uuid_b,
-                "target_type": "entity",
-            },
-            headers=auth_headers
-        )
+        uuid_a, uuid_b = artifact_pool[:2]
+        bulk_link([(uuid_a, uuid_b)])
 
         # Explore with kind filter
         response = client.post(
@@ -664,36 +360,11 @@ class TestExploreVerb:
         for edge in result["edges"]:
             assert edge["kind"] == "explicit_link"
 
-    def test_explore_limit(self, client, auth_headers):
+    def test_explore_limit(self, client, auth_headers, artifact_pool, bulk_link):
         """Test that explore respects limit parameter."""
-        # Create source entity
-        create_source = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Source"}},
-            headers=auth_headers
-        )
-        source_uuid = create_source.get_json()["result"]["uuid"]
-
-        # Create multiple target entities
-        for i in range(5):
-            create_target = client.post(
-                "/mg",
-                json={"op": "create", "type": "Artifact", "data": {"name": f"Target{i}"}},
-                headers=auth_headers
-            )
-            target_uuid = create_target.get_json()["result"]["uuid"]
-
-            client.post(
-                "/mg",
-                json={
-                    "op": "link",
-                    "source": source_uuid,
-                    "source_type": "entity",
-                    "target": target_uuid,
-                    "target_type": "entity",
-                },
-                headers=auth_headers
-            )
+        # Fan out from one source to five targets
+        source_uuid, *target_uuids = artifact_pool
+        bulk_link([(source_uuid, target_uuid) for target_uuid in target_uuids])
 
         # Explore with limit
         response = client.post(
@@ -709,3 +380,56 @@ class TestExploreVerb:
         assert response.status_code == 200
         result = response.get_json()["result"]
         assert result["count"] <= 2
+
+    def test_explore_memo_cleared_by_link_in_batch(self, client, auth_headers, artifact_pool, bulk_link):
+        """Test repeated explores in a batch agree, and a link between them is seen."""
+        uuid_a, uuid_b, uuid_c = artifact_pool[:3]
+        bulk_link([(uuid_a, uuid_b)])
+
+        explore = {"op": "explore", "anchor": uuid_a, "direction": "outgoing", "radius": 1}
+        response = client.post(
+            "/mg",
+            json={
+                "op": "batch",
+                "ops": [
+                    explore,
+                    explore,
+                    {
+                        "op": "link",
+                        "source": uuid_a,
+                        "source_type": "entity",
+                        "target": uuid_c,
+                        "target_type": "entity",
+                    },
+                    explore,
+                ]
+            },
+            headers=auth_headers
+        )
+        assert response.status_code == 200
+        results = [r["result"] for r in response.get_json()["result"]["results"]]
+        assert results[0] == results[1]
+        assert len(results[0]["edges"]) == 1
+        assert len(results[3]["edges"]) == 2
+
+    def test_explore_memo_hit_returns_independent_copy(self, flask_app, artifact_pool, bulk_link):
+        """Test a memoized explore hands each caller its own result object."""
+        from api.handlers.core import handle_explore
+        from api.schemas.semantic import ExploreRequest
+
+        uuid_a, uuid_b = artifact_pool[:2]
+        bulk_link([(uuid_a, uuid_b)])
+        request = ExploreRequest(anchor=uuid_a, direction="outgoing", radius=1)
+
+        with flask_app.test_request_context():
+            first = handle_explore(request, "test-actor")
+            first["edges"].clear()
+            first["annotated"] = True
+
+            second = handle_explore(request, "test-actor")
+            third = handle_explore(request, "test-actor")
+
+        assert second is not third
+        assert len(second["edges"]) == 1
+        assert "annotated" not in second
+        assert second == third
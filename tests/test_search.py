@@ -236,7 +236,7 @@ class TestSearchVerb:
         assert len(result["results"]) <= 2
 
     def test_search_empty_results(self, client, auth_headers):
-        """Test search that returns very few results."""
+        """Test search for content that does not exist returns no results."""
         # Search for highly unique content that won't exist
         unique_query = "ZzzNonExistentContentXyz789Abc"
         response = client.post(
@@ -254,9 +254,9 @@ class TestSearchVerb:
         data = response.get_json()
         assert data["ok"] is True
         result = data["result"]
-        # Should find very few to no results for this unique search term
-        # Note: Due to test database state, there might be some pre-existing data
-        assert result["count"] < 3  # Should find at most 2-3 results even if there's pre-existing data
+        # Each test gets fresh databases, so nothing can match
+        assert result["count"] == 0
+        assert result["results"] == []
 
     def test_search_fuzzy_matching(self, client, auth_headers):
         """Test fuzzy matching with partial strings."""
@@ -309,3 +309,86 @@ class TestSearchVerb:
         data = response.get_json()
         result = data["result"]
         assert len(result["results"]) >= 1
+
+    def test_search_all_limit_caps_merged_results(self, client, auth_headers):
+        """Test limit applies to entities and facts combined, split between them."""
+        from system.soil.fact import Fact, generate_soil_uuid
+        from utils import isodatetime
+
+        with get_core() as core:
+            for i in range(2):
+                core.entity.create(
+                    entity_type="Artifact",
+                    data=f'{{"name": "Ledger {i}"}}'
+                )
+
+        with get_soil() as soil:
+            now = isodatetime.now()
+            soil.create_fact(Fact(
+                uuid=generate_soil_uuid(),
+                _type="Note",
+                realized_at=now,
+                canonical_at=now,
+                data={"text": "Ledger reconciliation notes"},
+                metadata=None
+            ))
+
+        response = client.post(
+            "/mg",
+            json={
+                "op": "search",
+                "query": "Ledger",
+                "target_type": "all",
+                "coverage": "content",
+                "limit": 2,
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        result = response.get_json()["result"]
+        assert result["count"] == 2
+        # Entities alone could fill the page; the fact still gets its share
+        kinds = [r.get("kind") for r in result["results"]]
+        assert kinds.count("fact") == 1
+        assert kinds[-1] == "fact"
+
+    def test_search_all_sizes_fact_query_from_entity_results(self, client, auth_headers, monkeypatch):
+        """Test facts are only requested for the slots entities leave, and Soil is skipped when none are left."""
+        from system.soil.database import Soil
+
+        with get_core() as core:
+            for i in range(3):
+                core.entity.create(
+                    entity_type="Artifact",
+                    data=f'{{"name": "Budget {i}"}}'
+                )
+
+        requested_limits = []
+        original_search_items = Soil.search_items
+
+        def _recording_search_items(self, *args, **kwargs):
+            requested_limits.append(kwargs["limit"])
+            return original_search_items(self, *args, **kwargs)
+
+        monkeypatch.setattr(Soil, "search_items", _recording_search_items)
+
+        search = {
+            "op": "search",
+            "query": "Budget",
+            "target_type": "all",
+            "coverage": "content",
+        }
+
+        # 3 entities can fill their half of 4, so facts get the other 2
+        response = client.post("/mg", json={**search, "limit": 4}, headers=auth_headers)
+        assert response.status_code == 200
+        assert requested_limits == [2]
+        # No facts matched, so entities take the unused share
+        assert response.get_json()["result"]["count"] == 3
+
+        # With limit=1 the entity fills the page and Soil is never searched
+        response = client.post("/mg", json={**search, "limit": 1}, headers=auth_headers)
+        assert response.status_code == 200
+        assert requested_limits == [2]
+        assert response.get_json()["result"]["count"] == 1
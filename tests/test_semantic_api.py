@@ -152,19 +152,14 @@ class TestCreateVerb:
 class TestGetVerb:
     """Tests for get verb."""
 
-    def test_get_entity(self, client, auth_headers):
+    def test_get_entity(self, client, auth_headers, dispatch_verb):
         """Test getting an entity by UUID."""
         # First create an entity
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Entity",
-                "data": {"name": "Test"}
-            },
-            headers=auth_headers
-        )
-        entity_uuid = create_response.get_json()["result"]["uuid"]
+        entity_uuid = dispatch_verb({
+            "op": "create",
+            "type": "Entity",
+            "data": {"name": "Test"}
+        })["uuid"]
 
         # Get the entity
         response = client.post(
@@ -181,19 +176,14 @@ class TestGetVerb:
         assert data["ok"] is True
         assert data["result"]["uuid"] == entity_uuid
 
-    def test_get_entity_with_uuid_prefix(self, client, auth_headers):
+    def test_get_entity_with_uuid_prefix(self, client, auth_headers, dispatch_verb):
         """Test getting entity accepts prefixed UUID."""
         # Create entity
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Entity",
-                "data": {}
-            },
-            headers=auth_headers
-        )
-        entity_uuid = create_response.get_json()["result"]["uuid"]
+        entity_uuid = dispatch_verb({
+            "op": "create",
+            "type": "Entity",
+            "data": {}
+        })["uuid"]
 
         # Get with prefix
         response = client.post(
@@ -227,19 +217,14 @@ class TestGetVerb:
 class TestEditVerb:
     """Tests for edit verb with set/unset semantics."""
 
-    def test_edit_entity_set(self, client, auth_headers):
+    def test_edit_entity_set(self, client, auth_headers, dispatch_verb):
         """Test editing entity with set operation."""
         # Create entity
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Entity",
-                "data": {"name": "Original", "value": 1}
-            },
-            headers=auth_headers
-        )
-        entity_uuid = create_response.get_json()["result"]["uuid"]
+        entity_uuid = dispatch_verb({
+            "op": "create",
+            "type": "Entity",
+            "data": {"name": "Original", "value": 1}
+        })["uuid"]
 
         # Edit with set
         response = client.post(
@@ -259,19 +244,14 @@ class TestEditVerb:
         assert data["result"]["data"]["new_field"] == "added"
         assert data["result"]["data"]["value"] == 1  # Original value preserved
 
-    def test_edit_entity_unset(self, client, auth_headers):
+    def test_edit_entity_unset(self, client, auth_headers, dispatch_verb):
         """Test editing entity with unset operation."""
         # Create entity
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Entity",
-                "data": {"name": "Test", "temp": "remove_me"}
-            },
-            headers=auth_headers
-        )
-        entity_uuid = create_response.get_json()["result"]["uuid"]
+        entity_uuid = dispatch_verb({
+            "op": "create",
+            "type": "Entity",
+            "data": {"name": "Test", "temp": "remove_me"}
+        })["uuid"]
 
         # Edit with unset
         response = client.post(
@@ -290,19 +270,14 @@ class TestEditVerb:
         assert "temp" not in data["result"]["data"]
         assert data["result"]["data"]["name"] == "Test"
 
-    def test_edit_entity_set_and_unset(self, client, auth_headers):
+    def test_edit_entity_set_and_unset(self, client, auth_headers, dispatch_verb):
         """Test editing entity with both set and unset."""
         # Create entity
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Entity",
-                "data": {"old": "value", "keep": "this"}
-            },
-            headers=auth_headers
-        )
-        entity_uuid = create_response.get_json()["result"]["uuid"]
+        entity_uuid = dispatch_verb({
+            "op": "create",
+            "type": "Entity",
+            "data": {"old": "value", "keep": "this"}
+        })["uuid"]
 
         # Edit with set and unset
         response = client.post(
@@ -327,19 +302,14 @@ class TestEditVerb:
 class TestForgetVerb:
     """Tests for forget verb (soft delete)."""
 
-    def test_forget_entity(self, client, auth_headers):
+    def test_forget_entity(self, client, auth_headers, dispatch_verb):
         """Test forgetting an entity (soft delete)."""
         # Create entity
-        create_response = client.post(
-            "/mg",
-            json={
-                "op": "create",
-                "type": "Entity",
-                "data": {"name": "To Forget"}
-            },
-            headers=auth_headers
-        )
-        entity_uuid = create_response.get_json()["result"]["uuid"]
+        entity_uuid = dispatch_verb({
+            "op": "create",
+            "type": "Entity",
+            "data": {"name": "To Forget"}
+        })["uuid"]
 
         # Forget entity
         response = client.post(
@@ -623,22 +593,17 @@ class TestAddVerb:
 class TestAmendVerb:
     """Tests for amend verb (Soil bundle)."""
 
-    def test_amend_fact(self, client, auth_headers):
+    def test_amend_fact(self, client, auth_headers, dispatch_verb):
         """Test amending a fact creates superseding fact."""
         # Create original fact
-        add_response = client.post(
-            "/mg",
-            json={
-                "op": "add",
-                "type": "Note",
-                "data": {
-                    "title": "Original",
-                    "description": "Original content"
-                }
-            },
-            headers=auth_headers
-        )
-        fact_uuid = add_response.get_json()["result"]["uuid"]
+        fact_uuid = dispatch_verb({
+            "op": "add",
+            "type": "Note",
+            "data": {
+                "title": "Original",
+                "description": "Original content"
+            }
+        })["uuid"]
 
         # Amend the fact
         response = client.post(
@@ -677,20 +642,15 @@ class TestAmendVerb:
         assert original["superseded_by"] is not None
         assert original["superseded_at"] is not None
 
-    def test_amend_fact_preserves_metadata(self, client, auth_headers):
+    def test_amend_fact_preserves_metadata(self, client, auth_headers, dispatch_verb):
         """Test amending a fact preserves original metadata."""
         # Create fact with metadata
-        add_response = client.post(
-            "/mg",
-            json={
-                "op": "add",
-                "type": "Note",
-                "data": {"description": "Test"},
-                "metadata": {"original": "value"}
-            },
-            headers=auth_headers
-        )
-        fact_uuid = add_response.get_json()["result"]["uuid"]
+        fact_uuid = dispatch_verb({
+            "op": "add",
+            "type": "Note",
+            "data": {"description": "Test"},
+            "metadata": {"original": "value"}
+        })["uuid"]
 
         # Amend with additional metadata
         response = client.post(
@@ -724,19 +684,14 @@ class TestAmendVerb:
 
         assert response.status_code == 404
 
-    def test_amend_superseded_fact_fails(self, client, auth_headers):
+    def test_amend_superseded_fact_fails(self, client, auth_headers, dispatch_verb):
         """Test amending a fact that is already superseded fails."""
         # Create and amend a fact
-        add_response = client.post(
-            "/mg",
-            json={
-                "op": "add",
-                "type": "Note",
-                "data": {"description": "Original"}
-            },
-            headers=auth_headers
-        )
-        fact_uuid = add_response.get_json()["result"]["uuid"]
+        fact_uuid = dispatch_verb({
+            "op": "add",
+            "type": "Note",
+            "data": {"description": "Original"}
+        })["uuid"]
 
         client.post(
             "/mg",
@@ -768,19 +723,14 @@ class TestAmendVerb:
 class TestGetFactVerb:
     """Tests for get verb with facts (Soil bundle)."""
 
-    def test_get_fact_by_uuid(self, client, auth_headers):
+    def test_get_fact_by_uuid(self, client, auth_headers, dispatch_verb):
         """Test getting a fact by UUID."""
         # Create a fact
-        add_response = client.post(
-            "/mg",
-            json={
-                "op": "add",
-                "type": "Note",
-                "data": {"description": "Test note"}
-            },
-            headers=auth_headers
-        )
-        fact_uuid = add_response.get_json()["result"]["uuid"]
+        fact_uuid = dispatch_verb({
+            "op": "add",
+            "type": "Note",
+            "data": {"description": "Test note"}
+        })["uuid"]
 
         # Get the fact
         response = client.post(
@@ -797,19 +747,14 @@ class TestGetFactVerb:
         assert data["ok"] is True
         assert data["result"]["uuid"] == fact_uuid
 
-    def test_get_fact_routes_on_prefix(self, client, auth_headers):
+    def test_get_fact_routes_on_prefix(self, client, auth_headers, dispatch_verb):
         """Test get verb routes correctly based on UUID prefix."""
         # Create a fact (soil_ prefix)
-        add_response = client.post(
-            "/mg",
-            json={
-                "op": "add",
-                "type": "Note",
-                "data": {"description": "Test"}
-            },
-            headers=auth_headers
-        )
-        fact_uuid = add_response.get_json()["result"]["uuid"]
+        fact_uuid = dispatch_verb({
+            "op": "add",
+            "type": "Note",
+            "data": {"description": "Test"}
+        })["uuid"]
 
         # Get with soil_ prefix
         response = client.post(
@@ -915,19 +860,14 @@ class TestQueryFactsVerb:
         for result in data["result"]["results"]:
             assert result["type"] == "Note"
 
-    def test_query_facts_excludes_superseded(self, client, auth_headers):
+    def test_query_facts_excludes_superseded(self, client, auth_headers, dispatch_verb):
         """Test query excludes superseded facts by default."""
         # Create and supersede a fact
-        add_response = client.post(
-            "/mg",
-            json={
-                "op": "add",
-                "type": "Note",
-                "data": {"description": "Original"}
-            },
-            headers=auth_headers
-        )
-        fact_uuid = add_response.get_json()["result"]["uuid"]
+        fact_uuid = dispatch_verb({
+            "op": "add",
+            "type": "Note",
+            "data": {"description": "Original"}
+        })["uuid"]
 
         client.post(
             "/mg",
@@ -991,22 +931,12 @@ class TestQueryFactsVerb:
 class TestLinkVerb:
     """Tests for link verb (Relations bundle - RFC-002)."""
 
-    def test_link_entities(self, client, auth_headers):
+    def test_link_entities(self, client, auth_headers, dispatch_verb):
         """Test creating a user relation between two entities."""
         # Create two entities
-        source_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Source"}},
-            headers=auth_headers
-        )
-        source_uuid = source_response.get_json()["result"]["uuid"]
+        source_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Source"}})["uuid"]
 
-        target_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Target"}},
-            headers=auth_headers
-        )
-        target_uuid = target_response.get_json()["result"]["uuid"]
+        target_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Target"}})["uuid"]
 
         # Create link
         response = client.post(
@@ -1039,22 +969,12 @@ class TestLinkVerb:
         assert "last_access_at" in result
         assert "created_at" in result
 
-    def test_link_with_custom_horizon(self, client, auth_headers):
+    def test_link_with_custom_horizon(self, client, auth_headers, dispatch_verb):
         """Test creating a link with custom initial time horizon."""
         # Create entities
-        source_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        source_uuid = source_response.get_json()["result"]["uuid"]
+        source_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
-        target_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        target_uuid = target_response.get_json()["result"]["uuid"]
+        target_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
         # Create link with 30-day horizon
         response = client.post(
@@ -1079,22 +999,12 @@ class TestLinkVerb:
         expected_horizon = current_day() + 30
         assert data["result"]["time_horizon"] == expected_horizon
 
-    def test_link_accepts_uuids_without_prefix(self, client, auth_headers):
+    def test_link_accepts_uuids_without_prefix(self, client, auth_headers, dispatch_verb):
         """Test link works with UUIDs without prefix."""
         # Create entities
-        source_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        source_uuid = source_response.get_json()["result"]["uuid"]
+        source_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
-        target_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        target_uuid = target_response.get_json()["result"]["uuid"]
+        target_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
         # Strip prefixes
         from utils import uid
@@ -1121,22 +1031,12 @@ class TestLinkVerb:
         assert data["result"]["source"] == source_uuid
         assert data["result"]["target"] == target_uuid
 
-    def test_link_with_metadata(self, client, auth_headers):
+    def test_link_with_metadata(self, client, auth_headers, dispatch_verb):
         """Test creating a link with metadata."""
         # Create entities
-        source_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        source_uuid = source_response.get_json()["result"]["uuid"]
+        source_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
-        target_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        target_uuid = target_response.get_json()["result"]["uuid"]
+        target_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
         # Create link with metadata
         response = client.post(
@@ -1156,22 +1056,12 @@ class TestLinkVerb:
         data = response.get_json()
         assert data["ok"] is True
 
-    def test_link_invalid_initial_horizon_fails(self, client, auth_headers):
+    def test_link_invalid_initial_horizon_fails(self, client, auth_headers, dispatch_verb):
         """Test creating a link with invalid initial_horizon_days fails."""
         # Create entities
-        source_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        source_uuid = source_response.get_json()["result"]["uuid"]
+        source_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
-        target_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {}},
-            headers=auth_headers
-        )
-        target_uuid = target_response.get_json()["result"]["uuid"]
+        target_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {}})["uuid"]
 
         # Try with negative horizon (should fail validation)
         response = client.post(
@@ -1211,15 +1101,10 @@ class TestLinkVerb:
 class TestSemanticAPIContextVerbs:
     """Test Semantic API context verbs (RFC-003 v4)."""
 
-    def test_enter_scope_adds_to_active_set(self, client, auth_headers):
+    def test_enter_scope_adds_to_active_set(self, client, auth_headers, dispatch_verb):
         """Test enter verb adds scope to active set."""
         # Create a scope (using Artifact as proxy)
-        scope_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope_uuid = scope_response.get_json()["result"]["uuid"]
+        scope_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
         # Enter scope
         response = client.post(
@@ -1238,22 +1123,12 @@ class TestSemanticAPIContextVerbs:
         assert scope_uuid in result["active_scopes"]
         assert result["primary_scope"] == scope_uuid  # First scope becomes primary
 
-    def test_enter_multiple_scopes(self, client, auth_headers):
+    def test_enter_multiple_scopes(self, client, auth_headers, dispatch_verb):
         """Test entering multiple scopes."""
         # Create two scopes
-        scope1_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope1_uuid = scope1_response.get_json()["result"]["uuid"]
+        scope1_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
-        scope2_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project B"}},
-            headers=auth_headers
-        )
-        scope2_uuid = scope2_response.get_json()["result"]["uuid"]
+        scope2_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project B"}})["uuid"]
 
         # Enter first scope
         client.post("/mg", json={"op": "enter", "scope": scope1_uuid}, headers=auth_headers)
@@ -1269,22 +1144,16 @@ class TestSemanticAPIContextVerbs:
         data = response.get_json()
         result = data["result"]
 
-        # Both scopes should be active
-        assert scope1_uuid in result["active_scopes"]
-        assert scope2_uuid in result["active_scopes"]
+        # Both scopes should be active, listed in sorted order
+        assert result["active_scopes"] == sorted([scope1_uuid, scope2_uuid])
 
         # First scope should still be primary (INV-11a: Focus Separation)
         assert result["primary_scope"] == scope1_uuid
 
-    def test_enter_already_active_scope_fails(self, client, auth_headers):
+    def test_enter_already_active_scope_fails(self, client, auth_headers, dispatch_verb):
         """Test entering a scope that's already active fails."""
         # Create and enter a scope
-        scope_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope_uuid = scope_response.get_json()["result"]["uuid"]
+        scope_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
         client.post("/mg", json={"op": "enter", "scope": scope_uuid}, headers=auth_headers)
 
@@ -1300,15 +1169,10 @@ class TestSemanticAPIContextVerbs:
         assert data["ok"] is False
         assert "already in active set" in data["error"]["message"]
 
-    def test_leave_scope_removes_from_active_set(self, client, auth_headers):
+    def test_leave_scope_removes_from_active_set(self, client, auth_headers, dispatch_verb):
         """Test leave verb removes scope from active set."""
         # Create and enter a scope
-        scope_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope_uuid = scope_response.get_json()["result"]["uuid"]
+        scope_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
         client.post("/mg", json={"op": "enter", "scope": scope_uuid}, headers=auth_headers)
 
@@ -1328,15 +1192,10 @@ class TestSemanticAPIContextVerbs:
         assert scope_uuid not in result["active_scopes"]
         assert result["primary_scope"] is None  # Leaving primary clears it
 
-    def test_leave_scope_not_active_fails(self, client, auth_headers):
+    def test_leave_scope_not_active_fails(self, client, auth_headers, dispatch_verb):
         """Test leaving a scope that's not active fails."""
         # Create a scope (but don't enter it)
-        scope_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope_uuid = scope_response.get_json()["result"]["uuid"]
+        scope_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
         # Try to leave without entering (no context frame exists)
         response = client.post(
@@ -1352,22 +1211,12 @@ class TestSemanticAPIContextVerbs:
         error_msg = data["error"]["message"].lower()
         assert "no active context frame" in error_msg or "not in active set" in error_msg
 
-    def test_focus_scope_changes_primary(self, client, auth_headers):
+    def test_focus_scope_changes_primary(self, client, auth_headers, dispatch_verb):
         """Test focus verb changes primary scope."""
         # Create two scopes
-        scope1_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope1_uuid = scope1_response.get_json()["result"]["uuid"]
+        scope1_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
-        scope2_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project B"}},
-            headers=auth_headers
-        )
-        scope2_uuid = scope2_response.get_json()["result"]["uuid"]
+        scope2_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project B"}})["uuid"]
 
         # Enter both scopes
         client.post("/mg", json={"op": "enter", "scope": scope1_uuid}, headers=auth_headers)
@@ -1390,15 +1239,10 @@ class TestSemanticAPIContextVerbs:
         assert scope1_uuid in result["active_scopes"]
         assert scope2_uuid in result["active_scopes"]
 
-    def test_focus_scope_not_active_fails(self, client, auth_headers):
+    def test_focus_scope_not_active_fails(self, client, auth_headers, dispatch_verb):
         """Test focusing on a scope that's not active fails."""
         # Create a scope (but don't enter it)
-        scope_response = client.post(
-            "/mg",
-            json={"op": "create", "type": "Artifact", "data": {"name": "Project A"}},
-            headers=auth_headers
-        )
-        scope_uuid = scope_response.get_json()["result"]["uuid"]
+        scope_uuid = dispatch_verb({"op": "create", "type": "Artifact", "data": {"name": "Project A"}})["uuid"]
 
         # Try to focus without entering (no context frame exists)
         response = client.post(
@@ -1414,6 +1258,19 @@ class TestSemanticAPIContextVerbs:
         error_msg = data["error"]["message"].lower()
         assert "no active context frame" in error_msg or "not in active set" in error_msg
 
+    def test_leave_without_context_frame_is_validation_error(self, client, auth_headers):
+        """Test leave before any enter reports a typed ValidationError."""
+        response = client.post(
+            "/mg",
+            json={"op": "leave", "scope": "core_00000000-0000-0000-0000-000000000000"},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+        error = response.get_json()["error"]
+        assert error["type"] == "ValidationError"
+        assert error["message"] == "No active context frame. You must enter a scope first."
+
     def test_context_verbs_require_authentication(self, client):
         """Test context verbs require authentication."""
         # Try to enter a scope without auth
@@ -1423,3 +1280,109 @@ class TestSemanticAPIContextVerbs:
         )
 
         assert response.status_code == 401
+
+
+class TestBatchVerb:
+    """Test batch dispatch of several operations in one request."""
+
+    def test_batch_runs_ops_in_order(self, client, auth_headers):
+        """Test batch returns one envelope per entry, in request order."""
+        response = client.post(
+            "/mg",
+            json={
+                "op": "batch",
+                "ops": [
+                    {"op": "create", "type": "Artifact", "data": {"name": "A"}},
+                    {"op": "create", "type": "Artifact", "data": {"name": "B"}},
+                    {"op": "query", "target_type": "entity", "type": "Artifact"},
+                ]
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        data = response.get_json()
+        assert data["ok"] is True
+        results = data["result"]["results"]
+        assert data["result"]["count"] == 3
+        assert [r["status"] for r in results] == [200, 200, 200]
+        assert results[0]["result"]["data"]["name"] == "A"
+        assert results[1]["result"]["data"]["name"] == "B"
+        assert results[2]["result"]["total"] >= 2
+
+    def test_batch_entry_failure_does_not_stop_batch(self, client, auth_headers):
+        """Test a failing entry reports its own error and later entries still run."""
+        response = client.post(
+            "/mg",
+            json={
+                "op": "batch",
+                "ops": [
+                    {"op": "get", "target": "core_00000000-0000-0000-0000-000000000000"},
+                    {"op": "create", "type": "Artifact", "data": {"name": "After"}},
+                ]
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        results = response.get_json()["result"]["results"]
+        assert results[0]["status"] == 404
+        assert results[0]["ok"] is False
+        assert results[1]["status"] == 200
+        assert results[1]["ok"] is True
+
+    def test_batch_abort_on_error_stops_at_failure(self, client, auth_headers):
+        """Test abort_on_error skips the entries after the first failure."""
+        response = client.post(
+            "/mg",
+            json={
+                "op": "batch",
+                "abort_on_error": True,
+                "ops": [
+                    {"op": "get", "target": "core_00000000-0000-0000-0000-000000000000"},
+                    {"op": "create", "type": "Artifact", "data": {"name": "Skipped"}},
+                ]
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        result = response.get_json()["result"]
+        assert result["count"] == 1
+        assert result["results"][0]["status"] == 404
+
+    def test_nested_batch_rejected(self, client, auth_headers):
+        """Test batch entries cannot themselves be batches."""
+        response = client.post(
+            "/mg",
+            json={
+                "op": "batch",
+                "ops": [{"op": "batch", "ops": [{"op": "query"}]}]
+            },
+            headers=auth_headers
+        )
+
+        assert response.status_code == 200
+        entry = response.get_json()["result"]["results"][0]
+        assert entry["status"] == 400
+        assert "unsupported" in entry["error"]["message"].lower()
+
+    def test_empty_batch_fails(self, client, auth_headers):
+        """Test batch requires at least one entry."""
+        response = client.post(
+            "/mg",
+            json={"op": "batch", "ops": []},
+            headers=auth_headers
+        )
+
+        assert response.status_code == 400
+
+
+class TestRequestSchemas:
+    """Tests for the op -> request schema mapping."""
+
+    def test_every_handled_op_has_a_schema(self):
+        """Every dispatchable op (except batch) should have a request schema."""
+        from api.semantic import HANDLERS, REQUEST_SCHEMAS
+
+        assert set(HANDLERS) | {"get", "query"} <= set(REQUEST_SCHEMAS)
@@ -21,6 +21,8 @@ import pytest
 
 from api.events import (
     EVENT_TYPES,
+    SSE_QUEUE_MAXSIZE,
+    SSE_RESYNC_EVENT,
     SSEConnection,
     SSEManager,
     publish_artifact_delta,
@@ -88,6 +90,16 @@ class TestSSEManager:
         assert removed.client_id == client_id
         assert client_id not in sse_manager._connections
 
+    def test_unregister_clears_scope_index(self):
+        """Test unregistering drops the connection from the scope index."""
+        manager = SSEManager()
+        client_id, _ = manager.register("user_789", "testuser", {"core_abc"})
+
+        manager.unregister(client_id)
+
+        assert "core_abc" not in manager._scope_index
+        assert manager.publish("artifact_delta", {}, scope_uuid="core_abc") == 0
+
     def test_unregister_nonexistent_connection(self):
         """Test unregistering a non-existent connection returns None."""
         result = sse_manager.unregister("sse_nonexistent")
@@ -123,6 +135,29 @@ class TestSSEManager:
         count = sse_manager.publish("artifact_delta", {"test": "data"})
         assert count == 0
 
+    def test_publish_overflow_closes_connection_with_resync(self):
+        """Test that a full queue ends the connection with a resync event instead of dropping silently."""
+        manager = SSEManager()
+        client_id, conn = manager.register("user_1", "user1", {"core_abc"})
+
+        for i in range(SSE_QUEUE_MAXSIZE):
+            assert manager.publish("artifact_delta", {"i": i}) == 1
+
+        assert manager.publish("artifact_delta", {"i": "overflow"}) == 0
+
+        # Stale events are replaced by a single terminal resync event
+        assert conn.queue.qsize() == 1
+        event = conn.queue.get_nowait()
+        assert event["type"] == SSE_RESYNC_EVENT
+        assert event["data"] == {"reason": "queue_overflow", "dropped_event": "artifact_delta"}
+
+        # The connection no longer receives events
+        assert manager.get_connection_count() == 0
+        assert "core_abc" not in manager._scope_index
+        assert manager.publish("artifact_delta", {"i": "after"}) == 0
+        assert conn.queue.empty()
+        assert manager.unregister(client_id) is None
+
     def test_publish_invalid_event_type_raises_error(self):
         """Test that publishing invalid event type raises ValueError."""
         client_id, _ = sse_manager.register("user_1", "user1", set())
@@ -148,6 +183,17 @@ class TestSSEConnection:
         assert conn.is_subscribed_to("core_abc") is True
         assert conn.is_subscribed_to("core_def") is True
 
+    def test_connection_is_slotted(self):
+        """Test SSEConnection does not carry a per-instance __dict__."""
+        conn = SSEConnection(
+            client_id="sse_1",
+            user_id="user_1",
+            username="user1",
+            subscribed_scopes=set()
+        )
+
+        assert not hasattr(conn, "__dict__")
+
     def test_is_subscribed_to_with_no_scope_match(self):
         """Test subscription check when scope doesn't match."""
         conn = SSEConnection(
@@ -415,6 +461,33 @@ class TestSSEEndpoint:
         # Check for 200 (streaming ready) or 401 (auth failed)
         assert response.status_code in (200, 401)
 
+    def test_events_stream_ends_with_resync_on_overflow(self, client, auth_headers):
+        """Test that a client that falls behind sees a resync event and the stream closes."""
+        for cid in list(sse_manager._connections.keys()):
+            sse_manager.unregister(cid)
+
+        # The view registers the connection before the body is iterated
+        response = client.get("/mg/events", headers=auth_headers, buffered=False)
+        assert response.status_code == 200
+        assert sse_manager.get_connection_count() == 1
+
+        for i in range(SSE_QUEUE_MAXSIZE + 1):
+            sse_manager.publish("artifact_delta", {"i": i})
+
+        # Bounded read: a stream that failed to close would keep sending keepalives
+        chunks = []
+        for chunk in response.response:
+            chunks.append(chunk.decode() if isinstance(chunk, bytes) else chunk)
+            if len(chunks) > 10:
+                break
+        response.close()
+
+        body = "".join(chunks)
+        assert f"event: {SSE_RESYNC_EVENT}\n" in body
+        assert body.endswith("\n\n")
+        assert len(chunks) == 2  # event line + data line, then the stream ended
+        assert sse_manager.get_connection_count() == 0
+
 
 class TestSSEStatsEndpoint:
     """Tests for /mg/events/stats endpoint."""